@@ -22,6 +22,24 @@ from ..integrations.registry import get_cicd, get_integrations_by_type, Integrat
 console = Console()
 ci_app = typer.Typer(help="CI/CD pipeline management")
 
+# Pipeline/job status -> rich markup icon
+_STATUS_ICONS = {
+    "success": "[green]✓[/green]",
+    "passed": "[green]✓[/green]",
+    "completed": "[green]✓[/green]",
+    "failed": "[red]✗[/red]",
+    "failure": "[red]✗[/red]",
+    "error": "[red]✗[/red]",
+    "running": "[yellow]●[/yellow]",
+    "in_progress": "[yellow]●[/yellow]",
+    "pending": "[blue]○[/blue]",
+    "queued": "[blue]○[/blue]",
+    "waiting": "[blue]○[/blue]",
+    "cancelled": "[dim]⊘[/dim]",
+    "canceled": "[dim]⊘[/dim]",
+    "skipped": "[dim]⊖[/dim]",
+}
+
 
 def _get_cicd():
     """Get the active CI/CD integration."""
@@ -54,23 +72,7 @@ def _check_cicd():
 
 def _status_icon(status: str) -> str:
     """Get icon for pipeline status."""
-    icons = {
-        "success": "[green]✓[/green]",
-        "passed": "[green]✓[/green]",
-        "completed": "[green]✓[/green]",
-        "failed": "[red]✗[/red]",
-        "failure": "[red]✗[/red]",
-        "error": "[red]✗[/red]",
-        "running": "[yellow]●[/yellow]",
-        "in_progress": "[yellow]●[/yellow]",
-        "pending": "[blue]○[/blue]",
-        "queued": "[blue]○[/blue]",
-        "waiting": "[blue]○[/blue]",
-        "cancelled": "[dim]⊘[/dim]",
-        "canceled": "[dim]⊘[/dim]",
-        "skipped": "[dim]⊖[/dim]",
-    }
-    return icons.get(status.lower(), "[dim]?[/dim]")
+    return _STATUS_ICONS.get(status.lower(), "[dim]?[/dim]")
 
 
 @ci_app.command("status")
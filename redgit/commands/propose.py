@@ -17,7 +17,7 @@ from ..core.llm import LLMClient
 from ..core.prompt import PromptManager
 from ..integrations.registry import get_task_management, get_code_hosting, get_notification
 from ..integrations.base import TaskManagementBase, Issue
-from ..plugins.registry import load_plugins, get_active_plugin
+from ..plugins.registry import load_plugins, get_active_plugin, detect_project_type
 from ..utils.security import filter_changes
 from ..utils.logging import get_logger
 from ..utils.notifications import NotificationService
@@ -422,7 +422,7 @@ def propose_cmd(
 
     # Load plugins
     plugins = load_plugins(config.get("plugins", {}))
-    active_plugin = get_active_plugin(plugins)
+    active_plugin = get_active_plugin(plugins, detect_project_type()) if plugins else None
 
     # Fetch and validate changes
     changes = _fetch_and_validate_changes(gitops, subtasks, task)
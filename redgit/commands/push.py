@@ -720,9 +720,8 @@ def _push_current_branch(
 def _get_unpushed_tags(gitops: GitOps) -> List[str]:
     """Get list of local tags not yet pushed to remote."""
     try:
-        # Get all local tags
-        local_tags = set(gitops.repo.git.tag().split("\n"))
-        local_tags.discard("")
+        # Get all local tags (read from refs, no `git tag` subprocess)
+        local_tags = {tag.name for tag in gitops.repo.tags}
 
         if not local_tags:
             return []
@@ -685,6 +685,9 @@ def _install_from_tap_url(
 
         # Register custom notification events from the integration
         _register_integration_notification_events(target_dir, name)
+    else:
+        from ..plugins.registry import clear_plugin_cache
+        clear_plugin_cache()
 
     # Success
     typer.echo("")
@@ -800,6 +803,9 @@ def _install_from_default_tap(
 
         # Register custom notification events from the integration
         _register_integration_notification_events(target_dir, name)
+    else:
+        from ..plugins.registry import clear_plugin_cache
+        clear_plugin_cache()
 
     # Success
     typer.echo("")
@@ -968,6 +974,9 @@ def uninstall_tap(name: str) -> bool:
     if item_type == "integration":
         from ..integrations.registry import refresh_integrations
         refresh_integrations()
+    else:
+        from ..plugins.registry import clear_plugin_cache
+        clear_plugin_cache()
 
     typer.secho(f"✅ Uninstalled: {name}", fg=typer.colors.GREEN)
     typer.echo(f"   Source was: {source}")
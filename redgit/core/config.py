@@ -2,6 +2,12 @@ from pathlib import Path
 from typing import Optional, Any, List
 import yaml
 
+# libyaml bindings are much faster; fall back to pure Python when missing
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 from .constants import (
     DEFAULT_QUALITY_THRESHOLD,
     SEMGREP_TIMEOUT,
@@ -81,13 +87,22 @@ DEFAULT_LOGGING = {
 
 
 class ConfigManager:
-    def __init__(self):
-        RETGIT_DIR.mkdir(exist_ok=True)
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Args:
+            root: Project directory containing .redgit (defaults to the current directory)
+        """
+        if root is None:
+            self.config_path = CONFIG_PATH
+            RETGIT_DIR.mkdir(exist_ok=True)
+        else:
+            self.config_path = Path(root) / CONFIG_PATH
+            (Path(root) / RETGIT_DIR).mkdir(exist_ok=True)
 
     def load(self) -> dict:
         """Load configuration from config.yaml"""
-        if CONFIG_PATH.exists():
-            config = yaml.safe_load(CONFIG_PATH.read_text()) or {}
+        if self.config_path.exists():
+            config = yaml.load(self.config_path.read_text(), Loader=YamlLoader) or {}
         else:
             config = {}
 
@@ -103,7 +118,9 @@ class ConfigManager:
 
     def save(self, config: dict):
         """Save configuration to config.yaml"""
-        CONFIG_PATH.write_text(yaml.dump(config, allow_unicode=True, sort_keys=False))
+        self.config_path.write_text(
+            yaml.dump(config, Dumper=YamlDumper, allow_unicode=True, sort_keys=False)
+        )
 
     def get_active_integration(self, integration_type: str) -> Optional[str]:
         """
@@ -119,13 +136,14 @@ class ConfigManager:
         active = config.get("active", {})
         return active.get(integration_type)
 
-    def set_active_integration(self, integration_type: str, name: str):
-        """Set the active integration for a given type."""
+    def set_active_integration(self, integration_type: str, name: str) -> dict:
+        """Set the active integration for a given type and return the saved config."""
         config = self.load()
         if "active" not in config:
             config["active"] = {}
         config["active"][integration_type] = name
         self.save(config)
+        return config
 
     def get_notifications_config(self) -> dict:
         """Get notification settings with defaults."""
@@ -469,12 +487,14 @@ class StateManager:
     def load(self) -> dict:
         """Load state from state.yaml"""
         if STATE_PATH.exists():
-            return yaml.safe_load(STATE_PATH.read_text()) or {}
+            return yaml.load(STATE_PATH.read_text(), Loader=YamlLoader) or {}
         return {}
 
     def save(self, state: dict):
         """Save state to state.yaml"""
-        STATE_PATH.write_text(yaml.dump(state, allow_unicode=True, sort_keys=False))
+        STATE_PATH.write_text(
+            yaml.dump(state, Dumper=YamlDumper, allow_unicode=True, sort_keys=False)
+        )
 
     def clear(self):
         """Clear state file"""
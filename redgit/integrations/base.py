@@ -9,6 +9,7 @@ Integration Types:
 - code_quality: SonarQube, CodeClimate, Snyk, Codecov
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
@@ -302,6 +303,24 @@ class IntegrationBase(ABC):
         return None
 
 
+def register_integration(cls):
+    """
+    Class decorator that marks cls as its module's integration class.
+
+    The registry checks the module-level INTEGRATION_CLASS attribute before
+    guessing class names, so decorated classes are found with one lookup.
+
+    Example:
+        @register_integration
+        class MyToolIntegration(NotificationBase):
+            name = "my-tool"
+    """
+    module = sys.modules.get(cls.__module__)
+    if module is not None:
+        module.INTEGRATION_CLASS = cls
+    return cls
+
+
 class TaskManagementBase(IntegrationBase):
     """
     Base class for task management integrations.
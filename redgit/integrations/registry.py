@@ -8,16 +8,26 @@ Supports:
 
 Integration classes must:
 - Inherit from IntegrationBase (or TaskManagementBase, CodeHostingBase, etc.)
-- Be named {Name}Integration (e.g., JiraIntegration, MyCustomIntegration)
+- Be decorated with @register_integration, or be named {Name}Integration
+  (e.g., JiraIntegration, MyCustomIntegration)
 - Have a 'name' class attribute matching the file/folder name
 """
 
+import functools
 import importlib
 import importlib.util
-import inspect
 import json
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, List, Optional, Any, Tuple, Type, Union
+
+# Faster JSON parsing (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .base import (
     IntegrationBase,
@@ -30,7 +40,7 @@ from .base import (
     CodeQualityBase
 )
 
-from ..core.config import GLOBAL_INTEGRATIONS_DIR
+from ..core.config import ConfigManager, GLOBAL_INTEGRATIONS_DIR
 
 # Builtin integrations directory (inside package)
 BUILTIN_INTEGRATIONS_DIR = Path(__file__).parent
@@ -46,12 +56,35 @@ PROJECT_INTEGRATIONS_DIR = Path(".redgit/integrations")
 # Note: Scout is now a core command (not an integration), so it's not listed here.
 CORE_INTEGRATIONS = set()
 
-# Cache for discovered integrations
-_integration_cache: Dict[str, Type[IntegrationBase]] = {}
+# Base classes that are never integrations themselves
+_ABSTRACT_BASES = frozenset({
+    IntegrationBase,
+    TaskManagementBase,
+    CodeHostingBase,
+    NotificationBase,
+    AnalysisBase,
+    CICDBase,
+    CodeQualityBase,
+})
+
+# Files/folders in an integrations directory that are never integrations
+_SKIP_NAMES = frozenset({"__init__", "__pycache__", "base", "registry", "install_schemas"})
+
+# Discovered integration locations: name -> [(path, is_builtin), ...], lowest priority first
+_integration_locations: Dict[str, List[Tuple[str, bool]]] = {}
+
+# Integration classes resolved on first access (None if the module failed to load)
+_integration_cache: Dict[str, Optional[Type[IntegrationBase]]] = {}
 _discovery_done = False
 
+# IntegrationType -> names, built from resolved classes on first type query
+_integrations_by_type: Optional[Dict[IntegrationType, List[str]]] = None
 
-def _discover_integrations(force: bool = False) -> Dict[str, Type[IntegrationBase]]:
+# Typer app (or None) per integration name, filled by get_integration_commands
+_commands_module_cache: Dict[str, Optional[Any]] = {}
+
+
+def _discover_integrations(force: bool = False) -> Dict[str, List[Tuple[str, bool]]]:
     """
     Discover all available integrations from builtin, global, and project directories.
 
@@ -60,62 +93,108 @@ def _discover_integrations(force: bool = False) -> Dict[str, Type[IntegrationBas
     2. Global integrations (tap-installed, ~/.redgit/integrations/)
     3. Project integrations (custom per-project, .redgit/integrations/)
 
+    The result is kept for the rest of the process; force=True rescans.
+
+    Modules are not imported here; see _resolve_integration().
+
     Returns:
-        Dict of integration_name -> integration_class
+        Dict of integration_name -> list of (path, is_builtin) candidates
     """
-    global _integration_cache, _discovery_done
+    global _integration_locations, _integration_cache, _integrations_by_type, _discovery_done
 
     if _discovery_done and not force:
-        return _integration_cache
+        return _integration_locations
 
+    _integration_locations = {}
     _integration_cache = {}
+    _integrations_by_type = None
 
-    # 1. Discover builtin integrations
-    _discover_from_directory(BUILTIN_INTEGRATIONS_DIR, is_builtin=True)
+    directories = [
+        (BUILTIN_INTEGRATIONS_DIR, True),
+        (GLOBAL_INTEGRATIONS_PATH, False),
+        (PROJECT_INTEGRATIONS_DIR, False),
+    ]
+    for directory, is_builtin in directories:
+        for name, path in _discover_from_directory(directory):
+            _integration_locations.setdefault(name, []).append((path, is_builtin))
 
-    # 2. Discover global integrations (tap-installed)
-    if GLOBAL_INTEGRATIONS_PATH.exists():
-        _discover_from_directory(GLOBAL_INTEGRATIONS_PATH, is_builtin=False)
+    _discovery_done = True
+    return _integration_locations
 
-    # 3. Discover project-specific integrations (can override global)
-    if PROJECT_INTEGRATIONS_DIR.exists():
-        _discover_from_directory(PROJECT_INTEGRATIONS_DIR, is_builtin=False)
 
-    _discovery_done = True
-    return _integration_cache
+def _resolve_integration(name: str) -> Optional[Type[IntegrationBase]]:
+    """
+    Import an integration's module and return its class, caching the result.
 
+    Candidates are tried from highest to lowest priority, so a project
+    integration that fails to load falls back to the global/builtin one.
+    """
+    if name in _integration_cache:
+        return _integration_cache[name]
 
-def _discover_from_directory(directory: Path, is_builtin: bool = False):
-    """Discover integrations from a directory."""
-    global _integration_cache
+    cls = None
+    for path, is_builtin in reversed(_discover_integrations().get(name, ())):
+        cls = _load_class_from_file(path, name, is_builtin)
+        if cls:
+            break
 
-    if not directory.exists():
-        return
+    _integration_cache[name] = cls
+    return cls
 
-    # Skip these files/folders
-    skip_names = {"__init__", "__pycache__", "base", "registry", "install_schemas"}
 
-    for item in directory.iterdir():
-        name = item.stem
+def _resolve_all_integrations() -> Dict[str, Type[IntegrationBase]]:
+    """Resolve every discovered integration, skipping ones that fail to load."""
+    classes = {}
+    for name in _discover_integrations():
+        cls = _resolve_integration(name)
+        if cls:
+            classes[name] = cls
+    return classes
 
-        if name.startswith("_") or name in skip_names:
-            continue
 
-        # Single file integration: name.py
-        if item.suffix == ".py" and item.is_file():
-            cls = _load_class_from_file(item, name, is_builtin)
-            if cls:
-                _integration_cache[name] = cls
+def _discover_from_directory(directory: Path) -> List[Tuple[str, str]]:
+    """
+    Find integration files in a directory.
+
+    Returns:
+        List of (integration_name, path) tuples
+    """
+    found = []
+    append = found.append
+    isfile = os.path.isfile
+    join = os.path.join
+
+    # scandir yields entries with cached file type info, avoiding a stat per check
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return found
+
+    with entries:
+        for entry in entries:
+            entry_name = entry.name
+            is_py = entry_name.endswith(".py")
+            stem = entry_name[:-3] if is_py else entry_name
+
+            if not stem or stem[0] in "_." or stem in _SKIP_NAMES:
+                continue
+
+            # Single file integration: name.py
+            if is_py:
+                if entry.is_file():
+                    append((stem, entry.path))
+
+            # Package integration: name/__init__.py
+            elif entry.is_dir():
+                init_path = join(entry.path, "__init__.py")
+                if isfile(init_path):
+                    append((stem, init_path))
 
-        # Package integration: name/__init__.py
-        elif item.is_dir() and (item / "__init__.py").exists():
-            cls = _load_class_from_file(item / "__init__.py", name, is_builtin)
-            if cls:
-                _integration_cache[name] = cls
+    return found
 
 
 def _load_class_from_file(
-    path: Path,
+    path: Union[str, Path],
     name: str,
     is_builtin: bool = False
 ) -> Optional[Type[IntegrationBase]]:
@@ -123,55 +202,75 @@ def _load_class_from_file(
     try:
         if is_builtin:
             # Use proper module import for builtin integrations
-            module_name = f"redgit.integrations.{name}"
+            module_name = _module_name(name)
             module = importlib.import_module(module_name)
         else:
             # Dynamic import for custom integrations
-            spec = importlib.util.spec_from_file_location(
-                f"custom_integration_{name}",
-                path
-            )
+            module_name = f"custom_integration_{name}"
+            spec = importlib.util.spec_from_file_location(module_name, path)
             if not spec or not spec.loader:
                 return None
 
             module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
             spec.loader.exec_module(module)
 
         # Find the integration class
-        return _find_integration_class(module, name)
+        cls = _find_integration_class(module, name)
+        if cls is not None:
+            return cls
 
     except Exception:
-        return None
+        pass
+
+    if not is_builtin:
+        sys.modules.pop(f"custom_integration_{name}", None)
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _module_name(name: str) -> str:
+    """Return the builtin module path for an integration name."""
+    return f"redgit.integrations.{name}"
+
+
+@functools.lru_cache(maxsize=64)
+def _class_name_guesses(name: str) -> Tuple[str, ...]:
+    """Return the conventional class names for an integration, most likely first."""
+    simple = f"{name.capitalize()}Integration"
+    camel = "".join(word.capitalize() for word in name.split("_")) + "Integration"
+    return (simple,) if camel == simple else (simple, camel)
+
+
+@functools.lru_cache(maxsize=64)
+def _command_module_names(name: str) -> Tuple[Tuple[str, ...], str]:
+    """Return the builtin command module paths and app attribute name for an integration."""
+    base = _module_name(name)
+    return (f"{base}.commands", f"{base}.cli"), f"{name}_app"
 
 
 def _find_integration_class(module, name: str) -> Optional[Type[IntegrationBase]]:
     """Find the integration class in a module."""
-    # Try {Name}Integration first (e.g., JiraIntegration)
-    class_name = f"{name.capitalize()}Integration"
-    if hasattr(module, class_name):
-        cls = getattr(module, class_name)
-        if _is_valid_integration_class(cls):
-            return cls
-
-    # Try CamelCase name (e.g., MyCustomIntegration for my_custom)
-    camel_name = "".join(word.capitalize() for word in name.split("_")) + "Integration"
-    if hasattr(module, camel_name):
-        cls = getattr(module, camel_name)
-        if _is_valid_integration_class(cls):
+    # Explicit registration via @register_integration
+    cls = getattr(module, "INTEGRATION_CLASS", None)
+    if cls is not None and _is_valid_integration_class(cls):
+        return cls
+
+    # Try {Name}Integration, then CamelCase (e.g., MyCustomIntegration for my_custom)
+    for class_name in _class_name_guesses(name):
+        cls = getattr(module, class_name, None)
+        if cls is not None and _is_valid_integration_class(cls):
             return cls
 
-    # Search all classes in module
-    for attr_name in dir(module):
-        if attr_name.startswith("_"):
+    # Last resort for unconventional class names: match on the name attribute
+    name_normalized = name.replace("-", "_")
+    for attr_name, attr in vars(module).items():
+        if attr_name.startswith("_") or not _is_valid_integration_class(attr):
             continue
-        attr = getattr(module, attr_name)
-        if _is_valid_integration_class(attr):
-            # Verify the class's name attribute matches (normalize hyphens/underscores)
-            if hasattr(attr, "name"):
-                attr_name_normalized = attr.name.replace("-", "_")
-                name_normalized = name.replace("-", "_")
-                if attr_name_normalized == name_normalized:
-                    return attr
+        # Verify the class's name attribute matches (normalize hyphens/underscores)
+        attr_name_value = getattr(attr, "name", None)
+        if attr_name_value and attr_name_value.replace("-", "_") == name_normalized:
+            return attr
 
     return None
 
@@ -179,15 +278,9 @@ def _find_integration_class(module, name: str) -> Optional[Type[IntegrationBase]
 def _is_valid_integration_class(cls) -> bool:
     """Check if a class is a valid integration class."""
     return (
-        inspect.isclass(cls) and
-        issubclass(cls, IntegrationBase) and
-        cls is not IntegrationBase and
-        cls is not TaskManagementBase and
-        cls is not CodeHostingBase and
-        cls is not NotificationBase and
-        cls is not AnalysisBase and
-        cls is not CICDBase and
-        cls is not CodeQualityBase
+        isinstance(cls, type) and
+        cls not in _ABSTRACT_BASES and
+        issubclass(cls, IntegrationBase)
     )
 
 
@@ -203,8 +296,7 @@ def get_integration_class(name: str) -> Optional[Type[IntegrationBase]]:
     Returns:
         Integration class or None
     """
-    integrations = _discover_integrations()
-    return integrations.get(name)
+    return _resolve_integration(name)
 
 
 def get_all_integrations() -> Dict[str, Type[IntegrationBase]]:
@@ -214,7 +306,7 @@ def get_all_integrations() -> Dict[str, Type[IntegrationBase]]:
     Returns:
         Dict of integration_name -> integration_class
     """
-    return _discover_integrations()
+    return _resolve_all_integrations()
 
 
 # Alias for consistency with prompt loading
@@ -225,11 +317,17 @@ def get_builtin_integrations(include_core: bool = False) -> List[str]:
     """
     List available builtin integration names.
 
+    Integrations whose module fails to load or defines no integration class
+    are left out.
+
     Args:
         include_core: If True, include core integrations (like scout).
                      If False (default), exclude them for installation lists.
     """
-    all_integrations = list(_discover_integrations().keys())
+    all_integrations = [
+        name for name in _discover_integrations()
+        if _resolve_integration(name) is not None
+    ]
     if include_core:
         return all_integrations
     return [name for name in all_integrations if name not in CORE_INTEGRATIONS]
@@ -245,14 +343,15 @@ def get_installable_integrations() -> List[str]:
 
 def get_integrations_by_type(integration_type: IntegrationType) -> List[str]:
     """List available integrations of a specific type."""
-    integrations = _discover_integrations()
-    result = []
+    global _integrations_by_type
 
-    for name, cls in integrations.items():
-        if hasattr(cls, "integration_type") and cls.integration_type == integration_type:
-            result.append(name)
+    if _integrations_by_type is None:
+        index: Dict[IntegrationType, List[str]] = {}
+        for name, cls in _resolve_all_integrations().items():
+            index.setdefault(getattr(cls, "integration_type", None), []).append(name)
+        _integrations_by_type = index
 
-    return result
+    return list(_integrations_by_type.get(integration_type, ()))
 
 
 def get_integration_type(name: str) -> Optional[IntegrationType]:
@@ -263,24 +362,27 @@ def get_integration_type(name: str) -> Optional[IntegrationType]:
     return None
 
 
-# Backward compatibility
-BUILTIN_INTEGRATIONS = property(lambda self: {
-    name: cls.integration_type
-    for name, cls in _discover_integrations().items()
-    if hasattr(cls, "integration_type")
-})
-
-
 def _get_builtin_integrations_dict() -> Dict[str, IntegrationType]:
     """Get dict of integration names to their types."""
     return {
         name: cls.integration_type
-        for name, cls in _discover_integrations().items()
+        for name, cls in _resolve_all_integrations().items()
         if hasattr(cls, "integration_type")
     }
 
-# For backward compatibility - expose as module-level dict
-BUILTIN_INTEGRATIONS = _get_builtin_integrations_dict()
+
+def __getattr__(name: str):
+    """
+    Build BUILTIN_INTEGRATIONS on first access (PEP 562).
+
+    Kept for backward compatibility; computing it imports every integration,
+    so it is deferred until something actually asks for it.
+    """
+    if name == "BUILTIN_INTEGRATIONS":
+        value = _get_builtin_integrations_dict()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ==================== Loading Functions ====================
@@ -326,24 +428,36 @@ def load_integration_by_name(name: str, config: dict) -> Optional[IntegrationBas
     return None
 
 
-def get_task_management(config: dict, active_name: Optional[str] = None) -> Optional[TaskManagementBase]:
+# Active-integration key in config["active"] -> required base class
+_DISPATCH: Dict[str, Type[IntegrationBase]] = {
+    "task_management": TaskManagementBase,
+    "code_hosting": CodeHostingBase,
+    "analysis": AnalysisBase,
+    "notification": NotificationBase,
+    "ci_cd": CICDBase,
+    "code_quality": CodeQualityBase,
+}
+
+
+def _get_active(kind: str, config: dict, active_name: Optional[str] = None) -> Optional[IntegrationBase]:
     """
-    Get the active task management integration.
+    Load the active integration for a kind if it is enabled and has the right base class.
 
     Args:
+        kind: Key in the config's 'active' section (see _DISPATCH)
         config: Full config dict (with 'active' and 'integrations' sections)
         active_name: Override active integration name
 
     Returns:
-        TaskManagementBase instance or None if not configured or disabled
+        Integration instance or None if not configured, disabled or of the wrong type
     """
     if not active_name:
-        active_name = config.get("active", {}).get("task_management")
+        active_name = (config.get("active") or {}).get(kind)
 
     if not active_name or active_name.lower() == "none":
         return None
 
-    integration_config = config.get("integrations", {}).get(active_name, {})
+    integration_config = (config.get("integrations") or {}).get(active_name, {})
 
     # Check if explicitly disabled
     if integration_config.get("enabled") is False:
@@ -351,39 +465,38 @@ def get_task_management(config: dict, active_name: Optional[str] = None) -> Opti
 
     integration = load_integration_by_name(active_name, integration_config)
 
-    if integration and isinstance(integration, TaskManagementBase):
-        # Double check enabled status after setup
-        if not integration.enabled:
-            return None
+    if integration and isinstance(integration, _DISPATCH[kind]):
         return integration
 
     return None
 
 
-def get_code_hosting(config: dict, active_name: Optional[str] = None) -> Optional[CodeHostingBase]:
+def get_task_management(config: dict, active_name: Optional[str] = None) -> Optional[TaskManagementBase]:
     """
-    Get the active code hosting integration.
+    Get the active task management integration.
 
     Args:
-        config: Full config dict
+        config: Full config dict (with 'active' and 'integrations' sections)
         active_name: Override active integration name
 
     Returns:
-        CodeHostingBase instance or None
+        TaskManagementBase instance or None if not configured or disabled
     """
-    if not active_name:
-        active_name = config.get("active", {}).get("code_hosting")
+    return _get_active("task_management", config, active_name)
 
-    if not active_name:
-        return None
 
-    integration_config = config.get("integrations", {}).get(active_name, {})
-    integration = load_integration_by_name(active_name, integration_config)
+def get_code_hosting(config: dict, active_name: Optional[str] = None) -> Optional[CodeHostingBase]:
+    """
+    Get the active code hosting integration.
 
-    if integration and isinstance(integration, CodeHostingBase):
-        return integration
+    Args:
+        config: Full config dict
+        active_name: Override active integration name
 
-    return None
+    Returns:
+        CodeHostingBase instance or None
+    """
+    return _get_active("code_hosting", config, active_name)
 
 
 def get_analysis(config: dict, active_name: Optional[str] = None) -> Optional[AnalysisBase]:
@@ -397,19 +510,7 @@ def get_analysis(config: dict, active_name: Optional[str] = None) -> Optional[An
     Returns:
         AnalysisBase instance or None
     """
-    if not active_name:
-        active_name = config.get("active", {}).get("analysis")
-
-    if not active_name:
-        return None
-
-    integration_config = config.get("integrations", {}).get(active_name, {})
-    integration = load_integration_by_name(active_name, integration_config)
-
-    if integration and isinstance(integration, AnalysisBase):
-        return integration
-
-    return None
+    return _get_active("analysis", config, active_name)
 
 
 def get_notification(config: dict, active_name: Optional[str] = None) -> Optional[NotificationBase]:
@@ -440,19 +541,7 @@ def get_notification(config: dict, active_name: Optional[str] = None) -> Optiona
                 level="success"
             )
     """
-    if not active_name:
-        active_name = config.get("active", {}).get("notification")
-
-    if not active_name:
-        return None
-
-    integration_config = config.get("integrations", {}).get(active_name, {})
-    integration = load_integration_by_name(active_name, integration_config)
-
-    if integration and isinstance(integration, NotificationBase):
-        return integration
-
-    return None
+    return _get_active("notification", config, active_name)
 
 
 def get_cicd(config: dict, active_name: Optional[str] = None) -> Optional[CICDBase]:
@@ -483,19 +572,7 @@ def get_cicd(config: dict, active_name: Optional[str] = None) -> Optional[CICDBa
             # List recent pipelines
             runs = cicd.list_pipelines(limit=5)
     """
-    if not active_name:
-        active_name = config.get("active", {}).get("ci_cd")
-
-    if not active_name:
-        return None
-
-    integration_config = config.get("integrations", {}).get(active_name, {})
-    integration = load_integration_by_name(active_name, integration_config)
-
-    if integration and isinstance(integration, CICDBase):
-        return integration
-
-    return None
+    return _get_active("ci_cd", config, active_name)
 
 
 def get_code_quality(config: dict, active_name: Optional[str] = None) -> Optional[CodeQualityBase]:
@@ -526,19 +603,7 @@ def get_code_quality(config: dict, active_name: Optional[str] = None) -> Optiona
             # Get project metrics
             metrics = quality.get_project_metrics()
     """
-    if not active_name:
-        active_name = config.get("active", {}).get("code_quality")
-
-    if not active_name:
-        return None
-
-    integration_config = config.get("integrations", {}).get(active_name, {})
-    integration = load_integration_by_name(active_name, integration_config)
-
-    if integration and isinstance(integration, CodeQualityBase):
-        return integration
-
-    return None
+    return _get_active("code_quality", config, active_name)
 
 
 def send_notification(
@@ -577,8 +642,6 @@ def send_notification(
             fields={"Branch": "main"}
         )
     """
-    from ..core.config import ConfigManager
-
     try:
         config = ConfigManager().load()
         notifier = get_notification(config)
@@ -610,17 +673,31 @@ def get_integration_commands(name: str):
     2. redgit.integrations.{name}.cli module with {name}_app
     3. Custom: .redgit/integrations/{name}/commands.py with {name}_app
 
+    Results (including "no commands") are cached per name until
+    refresh_integrations() is called.
+
     Returns:
         typer.Typer instance or None
     """
-    # Try builtin first
-    for module_suffix in ["commands", "cli"]:
+    if name not in _commands_module_cache:
+        _commands_module_cache[name] = _find_integration_commands(name)
+    return _commands_module_cache[name]
+
+
+def _find_integration_commands(name: str):
+    """Locate the typer app for an integration (uncached)."""
+    module_names, app_name = _command_module_names(name)
+
+    # Try builtin first. Only builtin package integrations can have command
+    # submodules, and find_spec checks for them without raising ImportError.
+    is_builtin = any(builtin for _, builtin in _discover_integrations().get(name, ()))
+    for module_name in module_names if is_builtin else ():
         try:
-            module_name = f"redgit.integrations.{name}.{module_suffix}"
+            if importlib.util.find_spec(module_name) is None:
+                continue
             module = importlib.import_module(module_name)
 
             # Look for {name}_app
-            app_name = f"{name}_app"
             if hasattr(module, app_name):
                 return getattr(module, app_name)
 
@@ -634,45 +711,50 @@ def get_integration_commands(name: str):
             continue
 
     # Try global integration commands
-    global_commands_path = GLOBAL_INTEGRATIONS_PATH / name / "commands.py"
-    if global_commands_path.exists():
-        try:
-            spec = importlib.util.spec_from_file_location(
-                f"global_commands_{name}",
-                global_commands_path
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                app_name = f"{name}_app"
-                if hasattr(module, app_name):
-                    return getattr(module, app_name)
-                if hasattr(module, "app"):
-                    return getattr(module, "app")
-        except Exception:
-            pass
+    app = _load_commands_app(
+        GLOBAL_INTEGRATIONS_PATH / name / "commands.py",
+        f"global_commands_{name}",
+        app_name
+    )
+    if app is not None:
+        return app
 
     # Try project-specific integration commands
-    project_commands_path = PROJECT_INTEGRATIONS_DIR / name / "commands.py"
-    if project_commands_path.exists():
-        try:
-            spec = importlib.util.spec_from_file_location(
-                f"project_commands_{name}",
-                project_commands_path
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                app_name = f"{name}_app"
-                if hasattr(module, app_name):
-                    return getattr(module, app_name)
-                if hasattr(module, "app"):
-                    return getattr(module, "app")
-        except Exception:
-            pass
+    return _load_commands_app(
+        PROJECT_INTEGRATIONS_DIR / name / "commands.py",
+        f"project_commands_{name}",
+        app_name
+    )
+
+
+def _load_commands_app(path: Path, module_name: str, app_name: str):
+    """
+    Load a typer app from a custom commands.py file.
 
+    The module is registered in sys.modules while it loads and removed again
+    if it fails or exposes no app.
+    """
+    if not path.is_file():
+        return None
+
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if not spec or not spec.loader:
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        app = getattr(module, app_name, None)
+        if app is None:
+            app = getattr(module, "app", None)
+        if app is not None:
+            return app
+    except Exception:
+        pass
+
+    sys.modules.pop(module_name, None)
     return None
 
 
@@ -731,11 +813,35 @@ def refresh_integrations():
     """Force refresh the integration cache (call after adding custom integrations)."""
     global _discovery_done
     _discovery_done = False
+    _commands_module_cache.clear()
+    globals().pop("BUILTIN_INTEGRATIONS", None)
     _discover_integrations(force=True)
 
 
 # ==================== Install Schema Loading ====================
 
+@functools.lru_cache(maxsize=None)
+def _builtin_dir_entries() -> frozenset:
+    """Entry names in the builtin integrations directory (scanned once per process)."""
+    try:
+        with os.scandir(BUILTIN_INTEGRATIONS_DIR) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _read_json_file(path: Path) -> Optional[Dict]:
+    """Read a JSON file, returning None if it is missing or invalid."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if HAS_ORJSON:
+            return orjson.loads(data)
+        return json.loads(data)
+    except Exception:
+        return None
+
+
 def get_install_schema(name: str) -> Optional[Dict]:
     """
     Get install schema for an integration.
@@ -752,24 +858,22 @@ def get_install_schema(name: str) -> Optional[Dict]:
     Returns:
         Schema dict or None
     """
-    # Check all locations in order
-    paths = [
-        # Builtin
-        BUILTIN_INTEGRATIONS_DIR / name / "install_schema.json",
-        BUILTIN_INTEGRATIONS_DIR / f"{name}_install_schema.json",
-        # Global (tap-installed)
-        GLOBAL_INTEGRATIONS_PATH / name / "install_schema.json",
-        # Project-specific
-        PROJECT_INTEGRATIONS_DIR / name / "install_schema.json",
-    ]
+    # Builtin candidates are checked against a cached listing of the package
+    # directory; global/project ones change at runtime (tap install) so they
+    # are opened directly instead of stat-ing first.
+    builtin_entries = _builtin_dir_entries()
+    paths = []
+    if name in builtin_entries:
+        paths.append(BUILTIN_INTEGRATIONS_DIR / name / "install_schema.json")
+    if f"{name}_install_schema.json" in builtin_entries:
+        paths.append(BUILTIN_INTEGRATIONS_DIR / f"{name}_install_schema.json")
+    paths.append(GLOBAL_INTEGRATIONS_PATH / name / "install_schema.json")
+    paths.append(PROJECT_INTEGRATIONS_DIR / name / "install_schema.json")
 
     for path in paths:
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                continue
+        schema = _read_json_file(path)
+        if schema is not None:
+            return schema
 
     return None
 
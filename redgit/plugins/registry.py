@@ -7,10 +7,13 @@ Supports:
 3. Project plugins: .redgit/plugins/{name}/__init__.py (custom per-project)
 """
 
+import functools
 import importlib
 import importlib.util
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 from ..core.config import GLOBAL_PLUGINS_DIR
 
@@ -23,10 +26,14 @@ GLOBAL_PLUGINS_PATH = GLOBAL_PLUGINS_DIR
 # Project-specific plugins directory (custom per-project)
 PROJECT_PLUGINS_DIR = Path(".redgit/plugins")
 
+# sys.modules name prefixes for custom plugin commands modules
+_GLOBAL_COMMANDS_PREFIX = "global_plugin_commands_"
+_PROJECT_COMMANDS_PREFIX = "project_plugin_commands_"
+
 # Available builtin plugins
 # Plugins are now loaded from tap (redgit-tap) via `rg install <plugin>`
 # No builtin plugins in core package
-BUILTIN_PLUGINS = []
+BUILTIN_PLUGINS = ()
 
 
 def detect_project_type() -> list:
@@ -35,17 +42,44 @@ def detect_project_type() -> list:
     return []
 
 
+def _scan_plugin_dir(directory: Path, allow_files: bool = False) -> Dict[str, Path]:
+    """
+    Map plugin names to their entry file in a directory.
+
+    Packages (name/__init__.py) are always included; single file plugins
+    (name.py) only when allow_files is set, and take precedence over a
+    package of the same name.
+    """
+    found = {}
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return found
+
+    with entries:
+        for entry in entries:
+            entry_name = entry.name
+            if entry_name.endswith(".py"):
+                if allow_files and entry.is_file():
+                    found[entry_name[:-3]] = Path(entry.path)
+            elif entry.is_dir():
+                init_path = Path(entry.path) / "__init__.py"
+                if init_path.is_file():
+                    found.setdefault(entry_name, init_path)
+
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_plugin_paths() -> Dict[str, Path]:
+    """Builtin plugin entry files (the package directory is scanned once per process)."""
+    return _scan_plugin_dir(BUILTIN_PLUGINS_DIR, allow_files=True)
+
+
 def get_builtin_plugins() -> List[str]:
     """List available builtin plugins"""
-    available = []
-    for name in BUILTIN_PLUGINS:
-        # Check for single file plugin (name.py)
-        if (BUILTIN_PLUGINS_DIR / f"{name}.py").exists():
-            available.append(name)
-        # Check for package plugin (name/__init__.py)
-        elif (BUILTIN_PLUGINS_DIR / name / "__init__.py").exists():
-            available.append(name)
-    return available
+    paths = _builtin_plugin_paths()
+    return [name for name in BUILTIN_PLUGINS if name in paths]
 
 
 def get_all_plugins() -> List[str]:
@@ -58,16 +92,10 @@ def get_all_plugins() -> List[str]:
     plugins = set(get_builtin_plugins())
 
     # Add global plugins (tap-installed)
-    if GLOBAL_PLUGINS_PATH.exists():
-        for item in GLOBAL_PLUGINS_PATH.iterdir():
-            if item.is_dir() and (item / "__init__.py").exists():
-                plugins.add(item.name)
+    plugins.update(_scan_plugin_dir(GLOBAL_PLUGINS_PATH))
 
     # Add project-specific plugins
-    if PROJECT_PLUGINS_DIR.exists():
-        for item in PROJECT_PLUGINS_DIR.iterdir():
-            if item.is_dir() and (item / "__init__.py").exists():
-                plugins.add(item.name)
+    plugins.update(_scan_plugin_dir(PROJECT_PLUGINS_DIR))
 
     return list(plugins)
 
@@ -101,57 +129,71 @@ def _load_plugin(name: str) -> Optional[Any]:
     1. Builtin plugins (package)
     2. Global plugins (tap-installed, ~/.redgit/plugins/)
     3. Project plugins (custom per-project, .redgit/plugins/)
+
+    Results are cached per name and project directory; call
+    clear_plugin_cache() after installing or removing plugins.
     """
+    return _load_plugin_for_project(name, PROJECT_PLUGINS_DIR.resolve())
+
+
+@functools.lru_cache(maxsize=32)
+def _load_plugin_for_project(name: str, project_dir: Path) -> Optional[Any]:
+    """Load a plugin by name, with project plugins taken from project_dir."""
     plugin = None
 
     # 1. Check builtin plugins
-    builtin_path = BUILTIN_PLUGINS_DIR / f"{name}.py"
-    if builtin_path.exists():
-        plugin = _load_plugin_from_file(builtin_path, name)
-    else:
-        package_path = BUILTIN_PLUGINS_DIR / name / "__init__.py"
-        if package_path.exists():
-            plugin = _load_plugin_from_file(package_path, name)
+    builtin_path = _builtin_plugin_paths().get(name)
+    if builtin_path:
+        plugin = _load_plugin_from_file(builtin_path, name, f"builtin_plugin_{name}")
 
     # 2. Check global plugins (override builtin)
     global_path = GLOBAL_PLUGINS_PATH / name / "__init__.py"
     if global_path.exists():
-        loaded = _load_plugin_from_file(global_path, name)
+        loaded = _load_plugin_from_file(global_path, name, f"global_plugin_{name}")
         if loaded:
             plugin = loaded
 
     # 3. Check project plugins (override global)
-    project_path = PROJECT_PLUGINS_DIR / name / "__init__.py"
+    project_path = project_dir / name / "__init__.py"
     if project_path.exists():
-        loaded = _load_plugin_from_file(project_path, name)
+        loaded = _load_plugin_from_file(project_path, name, f"project_plugin_{name}")
         if loaded:
             plugin = loaded
 
     return plugin
 
 
-def _load_plugin_from_file(path: Path, name: str) -> Optional[Any]:
-    """Load plugin from a file path"""
+def _load_plugin_from_file(path: Path, name: str, module_name: str) -> Optional[Any]:
+    """
+    Load plugin from a file path, registered in sys.modules as module_name.
+
+    Each source uses its own module name, so a failed project load does not
+    unregister a global plugin of the same name.
+    """
     try:
-        spec = importlib.util.spec_from_file_location(f"plugin_{name}", path)
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if not spec or not spec.loader:
+            return None
+
         module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
         spec.loader.exec_module(module)
 
         # Look for {Name}Plugin class
-        class_name = f"{name.capitalize()}Plugin"
-        if hasattr(module, class_name):
-            cls = getattr(module, class_name)
+        cls = getattr(module, f"{name.capitalize()}Plugin", None)
+        if cls is not None:
             return cls()
 
         # Try CamelCase (MyPluginPlugin for my_plugin)
         camel_name = "".join(word.capitalize() for word in name.split("_")) + "Plugin"
-        if hasattr(module, camel_name):
-            cls = getattr(module, camel_name)
+        cls = getattr(module, camel_name, None)
+        if cls is not None:
             return cls()
 
     except Exception:
         pass
 
+    sys.modules.pop(module_name, None)
     return None
 
 
@@ -163,22 +205,89 @@ def get_plugin_by_name(name: str) -> Optional[Any]:
     return _load_plugin(name)
 
 
-def get_active_plugin(plugins: Dict[str, Any]) -> Optional[Any]:
+def get_active_plugin(
+    plugins: Dict[str, Any],
+    hints: Optional[List[str]] = None
+) -> Optional[Any]:
     """
     Get the first plugin that matches the current project.
 
     Args:
         plugins: Dict of loaded plugins
+        hints: Likely plugin names (e.g. from detect_project_type()),
+            tried before the rest
 
     Returns:
         First matching plugin or None
     """
-    for plugin in plugins.values():
+    tried = set()
+    for name in hints or ():
+        plugin = plugins.get(name)
+        if plugin is None or name in tried:
+            continue
+        tried.add(name)
+        if hasattr(plugin, "match") and plugin.match():
+            return plugin
+
+    for name, plugin in plugins.items():
+        if name in tried:
+            continue
         if hasattr(plugin, "match") and plugin.match():
             return plugin
     return None
 
 
+def _load_commands_module(module_name: str, path: Optional[Path] = None) -> Optional[Any]:
+    """
+    Return a plugin commands module, reusing it if it is already imported.
+
+    Builtin modules are imported by name; custom ones are loaded from path
+    and registered in sys.modules under module_name. A registered custom
+    module is only reused if it was loaded from the same path.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None and (path is None or getattr(module, "__file__", None) == str(path)):
+        return module
+
+    if path is None:
+        try:
+            return importlib.import_module(module_name)
+        except ImportError:
+            return None
+
+    if not path.is_file():
+        return None
+
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+            return module
+    except Exception:
+        sys.modules.pop(module_name, None)
+
+    return None
+
+
+def _plugin_commands_modules(name: str, project_dir: Optional[Path] = None) -> Iterator[Any]:
+    """Yield a plugin's commands modules: builtin, global, then project if project_dir is given."""
+    sources = [
+        (f"redgit.plugins.{name}.commands", None),
+        (f"{_GLOBAL_COMMANDS_PREFIX}{name}", GLOBAL_PLUGINS_PATH / name / "commands.py"),
+    ]
+    if project_dir is not None:
+        sources.append(
+            (f"{_PROJECT_COMMANDS_PREFIX}{name}", project_dir / name / "commands.py")
+        )
+
+    for module_name, path in sources:
+        module = _load_commands_module(module_name, path)
+        if module is not None:
+            yield module
+
+
 def get_plugin_commands(name: str) -> Optional[Any]:
     """
     Get CLI commands (typer app) for a plugin.
@@ -189,56 +298,23 @@ def get_plugin_commands(name: str) -> Optional[Any]:
     Returns:
         Typer app if plugin has commands, None otherwise
     """
-    # Try builtin first
-    try:
-        module_name = f"redgit.plugins.{name}.commands"
-        module = importlib.import_module(module_name)
-
-        app_name = f"{name}_app"
-        if hasattr(module, app_name):
-            return getattr(module, app_name)
-    except ImportError:
-        pass
-
-    # Try global plugin commands
-    global_commands_path = GLOBAL_PLUGINS_PATH / name / "commands.py"
-    if global_commands_path.exists():
-        try:
-            spec = importlib.util.spec_from_file_location(
-                f"global_plugin_commands_{name}",
-                global_commands_path
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                app_name = f"{name}_app"
-                if hasattr(module, app_name):
-                    return getattr(module, app_name)
-                if hasattr(module, "app"):
-                    return getattr(module, "app")
-        except Exception:
-            pass
-
-    # Try project plugin commands
-    project_commands_path = PROJECT_PLUGINS_DIR / name / "commands.py"
-    if project_commands_path.exists():
-        try:
-            spec = importlib.util.spec_from_file_location(
-                f"project_plugin_commands_{name}",
-                project_commands_path
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                app_name = f"{name}_app"
-                if hasattr(module, app_name):
-                    return getattr(module, app_name)
-                if hasattr(module, "app"):
-                    return getattr(module, "app")
-        except Exception:
-            pass
+    return _plugin_commands_for_project(name, PROJECT_PLUGINS_DIR.resolve())
+
+
+@functools.lru_cache(maxsize=32)
+def _plugin_commands_for_project(name: str, project_dir: Path) -> Optional[Any]:
+    """Find a plugin's typer app, with project commands taken from project_dir."""
+    app_name = f"{name}_app"
+    for module in _plugin_commands_modules(name, project_dir):
+        app = getattr(module, app_name, None)
+        if app is not None:
+            return app
+        # Builtin commands must use {name}_app
+        if module.__name__.startswith("redgit."):
+            continue
+        app = getattr(module, "app", None)
+        if app is not None:
+            return app
 
     return None
 
@@ -265,10 +341,39 @@ def get_enabled_plugin_commands(config: dict) -> Dict[str, Any]:
     return commands
 
 
+def _extract_shortcuts(module, name: str) -> Dict[str, Any]:
+    """Collect shortcuts declared by a plugin commands module."""
+    declared = getattr(module, "SHORTCUTS", None)
+    if isinstance(declared, dict):
+        return dict(declared)
+
+    import typer
+
+    apps = {}
+    functions = {}
+    main_app = f"{name}_app"
+    for attr_name, attr in vars(module).items():
+        # Check for shortcut functions
+        if attr_name.endswith("_shortcut"):
+            functions[attr_name[:-len("_shortcut")]] = attr
+        # Check for shortcut Typer apps (e.g., release_app -> rg release),
+        # skipping the main plugin app (e.g., version_app for version plugin)
+        elif attr_name.endswith("_app") and attr_name != main_app:
+            if isinstance(attr, typer.Typer):
+                apps[attr_name[:-len("_app")]] = attr
+
+    # A *_shortcut function wins over a *_app of the same name
+    apps.update(functions)
+    return apps
+
+
 def get_plugin_shortcuts(name: str) -> Dict[str, Any]:
     """
     Get shortcut commands from a plugin.
 
+    A commands module can list them explicitly in a SHORTCUTS dict; otherwise
+    *_shortcut functions and extra *_app Typer apps are picked up by name.
+
     Args:
         name: Plugin name
 
@@ -276,47 +381,8 @@ def get_plugin_shortcuts(name: str) -> Dict[str, Any]:
         Dict of shortcut_name -> command_function or typer_app
     """
     shortcuts = {}
-
-    def extract_shortcuts(module):
-        """Extract shortcuts from a module."""
-        import typer
-        for attr_name in dir(module):
-            # Skip the main plugin app (e.g., version_app for version plugin)
-            if attr_name == f"{name}_app":
-                continue
-            # Check for shortcut functions
-            if attr_name.endswith("_shortcut"):
-                shortcut_name = attr_name.replace("_shortcut", "")
-                shortcuts[shortcut_name] = getattr(module, attr_name)
-            # Check for shortcut Typer apps (e.g., release_app -> rg release)
-            elif attr_name.endswith("_app"):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, typer.Typer):
-                    shortcut_name = attr_name.replace("_app", "")
-                    shortcuts[shortcut_name] = attr
-
-    # Try builtin
-    try:
-        module_name = f"redgit.plugins.{name}.commands"
-        module = importlib.import_module(module_name)
-        extract_shortcuts(module)
-    except ImportError:
-        pass
-
-    # Try global plugin
-    global_commands_path = GLOBAL_PLUGINS_PATH / name / "commands.py"
-    if global_commands_path.exists():
-        try:
-            spec = importlib.util.spec_from_file_location(
-                f"global_plugin_shortcuts_{name}",
-                global_commands_path
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                extract_shortcuts(module)
-        except Exception:
-            pass
+    for module in _plugin_commands_modules(name):
+        shortcuts.update(_extract_shortcuts(module, name))
 
     return shortcuts
 
@@ -339,4 +405,14 @@ def get_all_plugin_shortcuts(config: dict) -> Dict[str, Any]:
         shortcuts = get_plugin_shortcuts(name)
         all_shortcuts.update(shortcuts)
 
-    return all_shortcuts
\ No newline at end of file
+    return all_shortcuts
+
+
+def clear_plugin_cache():
+    """Forget cached plugin instances, command apps and custom commands modules."""
+    _load_plugin_for_project.cache_clear()
+    _plugin_commands_for_project.cache_clear()
+
+    prefixes = (_GLOBAL_COMMANDS_PREFIX, _PROJECT_COMMANDS_PREFIX)
+    for module_name in [m for m in sys.modules if m.startswith(prefixes)]:
+        del sys.modules[module_name]
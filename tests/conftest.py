@@ -2,7 +2,8 @@
 Pytest configuration and shared fixtures for RedGit tests.
 """
 
-import os
+import copy
+import subprocess
 import tempfile
 import shutil
 from pathlib import Path
@@ -10,6 +11,9 @@ from typing import Generator
 
 import pytest
 import yaml
+from typer.testing import CliRunner
+
+from redgit.core.config import YamlDumper
 
 
 @pytest.fixture
@@ -20,84 +24,100 @@ def temp_dir() -> Generator[Path, None, None]:
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
-@pytest.fixture
-def temp_git_repo(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary git repository."""
-    import subprocess
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory) -> Path:
+    """Build one git repository with an initial commit for the session."""
+    template = tmp_path_factory.mktemp("git_repo_template")
 
     # Initialize git repo
-    subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
+    subprocess.run(["git", "init"], cwd=template, capture_output=True)
     subprocess.run(
         ["git", "config", "user.email", "test@example.com"],
-        cwd=temp_dir, capture_output=True
+        cwd=template, capture_output=True
     )
     subprocess.run(
         ["git", "config", "user.name", "Test User"],
-        cwd=temp_dir, capture_output=True
+        cwd=template, capture_output=True
     )
 
     # Create initial commit
-    readme = temp_dir / "README.md"
+    readme = template / "README.md"
     readme.write_text("# Test Repository\n")
-    subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
+    subprocess.run(["git", "add", "."], cwd=template, capture_output=True)
     subprocess.run(
         ["git", "commit", "-m", "Initial commit"],
-        cwd=temp_dir, capture_output=True
+        cwd=template, capture_output=True
     )
 
-    yield temp_dir
+    return template
 
 
 @pytest.fixture
-def sample_config() -> dict:
-    """Return a sample RedGit configuration."""
-    return {
-        "project": {
-            "name": "TestProject"
-        },
-        "llm": {
-            "provider": "ollama",
-            "model": "qwen-coder",
-            "prompt": "auto",
-            "max_files": 100,
-            "include_content": False,
-            "timeout": 300
-        },
-        "plugins": {
-            "enabled": ["version", "changelog"],
-            "version": {
-                "current": "1.0.0",
-                "enabled": True
-            },
-            "changelog": {
-                "enabled": True,
-                "format": "markdown",
-                "output_dir": "changelogs"
-            }
-        },
-        "integrations": {},
-        "workflow": {
-            "strategy": "local-merge",
-            "auto_transition": True,
-            "create_missing_issues": "ask"
+def temp_git_repo(temp_dir: Path, _git_repo_template: Path) -> Generator[Path, None, None]:
+    """Create a temporary git repository (a copy of the session template)."""
+    shutil.copytree(_git_repo_template, temp_dir, dirs_exist_ok=True)
+    yield temp_dir
+
+
+# Tests get deep copies via sample_config, so they are free to mutate them
+SAMPLE_CONFIG = {
+    "project": {
+        "name": "TestProject"
+    },
+    "llm": {
+        "provider": "ollama",
+        "model": "qwen-coder",
+        "prompt": "auto",
+        "max_files": 100,
+        "include_content": False,
+        "timeout": 300
+    },
+    "plugins": {
+        "enabled": ["version", "changelog"],
+        "version": {
+            "current": "1.0.0",
+            "enabled": True
         },
-        "quality": {
+        "changelog": {
             "enabled": True,
-            "threshold": 70,
-            "fail_on_security": True
+            "format": "markdown",
+            "output_dir": "changelogs"
         }
+    },
+    "integrations": {},
+    "workflow": {
+        "strategy": "local-merge",
+        "auto_transition": True,
+        "create_missing_issues": "ask"
+    },
+    "quality": {
+        "enabled": True,
+        "threshold": 70,
+        "fail_on_security": True
     }
+}
 
 
 @pytest.fixture
-def config_file(temp_dir: Path, sample_config: dict) -> Path:
+def sample_config() -> dict:
+    """Return a sample RedGit configuration."""
+    return copy.deepcopy(SAMPLE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def _sample_config_yaml() -> str:
+    """Dump SAMPLE_CONFIG to YAML once for the session."""
+    return yaml.dump(SAMPLE_CONFIG, Dumper=YamlDumper, default_flow_style=False)
+
+
+@pytest.fixture
+def config_file(temp_dir: Path, _sample_config_yaml: str) -> Path:
     """Create a .redgit/config.yaml file in temp directory."""
     redgit_dir = temp_dir / ".redgit"
     redgit_dir.mkdir(parents=True, exist_ok=True)
 
     config_path = redgit_dir / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(sample_config, f)
+    config_path.write_text(_sample_config_yaml)
 
     return config_path
 
@@ -115,12 +135,16 @@ def mock_env(monkeypatch):
 
 
 @pytest.fixture
-def change_cwd(temp_dir: Path):
+def change_cwd(temp_dir: Path, monkeypatch) -> Path:
     """Change working directory to temp_dir for the test."""
-    original_cwd = os.getcwd()
-    os.chdir(temp_dir)
-    yield temp_dir
-    os.chdir(original_cwd)
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Shared CLI runner for invoking Typer apps."""
+    return CliRunner()
 
 
 @pytest.fixture
@@ -169,4 +193,5 @@ def pytest_configure(config):
     """Configure custom markers."""
     config.addinivalue_line("markers", "slow: marks tests as slow")
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
-    config.addinivalue_line("markers", "unit: marks tests as unit tests")
\ No newline at end of file
+    config.addinivalue_line("markers", "unit: marks tests as unit tests")
+    config.addinivalue_line("markers", "mutates_config: test writes to the shared CLI test config.yaml")
\ No newline at end of file
@@ -1,15 +1,63 @@
 """Tests for redgit/commands/ci.py - CI/CD command."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import typer
+from rich.table import Table
 
 from redgit.commands.ci import (
     _get_cicd,
     _check_cicd,
     _status_icon,
     ci_app,
+    console,
+    list_pipelines,
+    status_cmd,
 )
+from redgit.integrations.base import CICDBase, PipelineRun
+
+# Read-only pipeline runs shared by the display and trigger tests
+_SAMPLE_PIPELINE = PipelineRun(id="12345", name="Build", status="success", branch="main", duration=120)
+_PENDING_PIPELINE = PipelineRun(id="99999", name="Build", status="pending")
+
+
+@pytest.fixture
+def mock_cicd():
+    """CI/CD integration mock with no pipelines."""
+    cicd = MagicMock(spec=CICDBase)
+    cicd.name = "GitHub Actions"
+    cicd.list_pipelines.return_value = []
+    return cicd
+
+
+@pytest.fixture
+def printed(monkeypatch):
+    """Capture console.print calls in the ci module, one string per call."""
+    lines = []
+
+    def fake_print(*args, **kwargs):
+        lines.append(" ".join(str(arg) for arg in args))
+
+    monkeypatch.setattr(console, "print", fake_print)
+    return lines
+
+
+def _stub_cicd(name="GitHub Actions", pipelines=()):
+    """Plain CI/CD stand-in for tests that never assert on calls."""
+    return SimpleNamespace(
+        name=name,
+        list_pipelines=lambda **kwargs: list(pipelines),
+    )
+
+
+def _stub_config_manager(config):
+    """ConfigManager stand-in class whose load() returns config."""
+    class _StubConfigManager:
+        def load(self):
+            return config
+
+    return _StubConfigManager
 
 
 # ==================== Tests for _get_cicd ====================
@@ -18,22 +66,21 @@ class TestGetCicd:
     """Tests for _get_cicd function."""
 
     @patch('redgit.commands.ci.get_cicd')
-    @patch('redgit.commands.ci.ConfigManager')
-    def test_returns_cicd_integration(self, mock_config, mock_get_cicd):
+    def test_returns_cicd_integration(self, mock_get_cicd, mock_cicd, monkeypatch):
         """Test returns CI/CD integration from config."""
-        mock_config.return_value.load.return_value = {"integrations": {}}
-        mock_cicd = MagicMock()
+        config = {"integrations": {}}
+        monkeypatch.setattr('redgit.commands.ci.ConfigManager', _stub_config_manager(config))
         mock_get_cicd.return_value = mock_cicd
 
         result = _get_cicd()
 
         assert result == mock_cicd
+        mock_get_cicd.assert_called_once_with(config)
 
     @patch('redgit.commands.ci.get_cicd')
-    @patch('redgit.commands.ci.ConfigManager')
-    def test_returns_none_when_not_configured(self, mock_config, mock_get_cicd):
+    def test_returns_none_when_not_configured(self, mock_get_cicd, monkeypatch):
         """Test returns None when not configured."""
-        mock_config.return_value.load.return_value = {}
+        monkeypatch.setattr('redgit.commands.ci.ConfigManager', _stub_config_manager({}))
         mock_get_cicd.return_value = None
 
         result = _get_cicd()
@@ -47,19 +94,17 @@ class TestCheckCicd:
     """Tests for _check_cicd function."""
 
     @patch('redgit.commands.ci._get_cicd')
-    def test_returns_cicd_when_configured(self, mock_get_cicd):
+    def test_returns_cicd_when_configured(self, mock_get_cicd, mock_cicd):
         """Test returns CI/CD integration when configured."""
-        mock_cicd = MagicMock()
         mock_get_cicd.return_value = mock_cicd
 
         result = _check_cicd()
 
         assert result == mock_cicd
 
-    @patch('redgit.commands.ci.console.print')
     @patch('redgit.commands.ci.get_integrations_by_type')
     @patch('redgit.commands.ci._get_cicd')
-    def test_raises_exit_when_not_configured(self, mock_get_cicd, mock_get_integrations, mock_print):
+    def test_raises_exit_when_not_configured(self, mock_get_cicd, mock_get_integrations, printed):
         """Test raises Exit when not configured."""
         mock_get_cicd.return_value = None
         mock_get_integrations.return_value = ["github-actions", "gitlab-ci"]
@@ -67,10 +112,9 @@ class TestCheckCicd:
         with pytest.raises(typer.Exit):
             _check_cicd()
 
-    @patch('redgit.commands.ci.console.print')
     @patch('redgit.commands.ci.get_integrations_by_type')
     @patch('redgit.commands.ci._get_cicd')
-    def test_shows_available_integrations(self, mock_get_cicd, mock_get_integrations, mock_print):
+    def test_shows_available_integrations(self, mock_get_cicd, mock_get_integrations, printed):
         """Test shows available integrations when not configured."""
         mock_get_cicd.return_value = None
         mock_get_integrations.return_value = ["github-actions"]
@@ -79,8 +123,7 @@ class TestCheckCicd:
             _check_cicd()
 
         # Should mention available integration
-        calls = [str(c) for c in mock_print.call_args_list]
-        assert any("github-actions" in c for c in calls)
+        assert any("github-actions" in line for line in printed)
 
 
 # ==================== Tests for _status_icon ====================
@@ -88,45 +131,36 @@ class TestCheckCicd:
 class TestStatusIcon:
     """Tests for _status_icon function."""
 
-    def test_success_statuses(self):
-        """Test success statuses return green checkmark."""
-        assert "[green]" in _status_icon("success")
-        assert "[green]" in _status_icon("passed")
-        assert "[green]" in _status_icon("completed")
-
-    def test_failed_statuses(self):
-        """Test failed statuses return red X."""
-        assert "[red]" in _status_icon("failed")
-        assert "[red]" in _status_icon("failure")
-        assert "[red]" in _status_icon("error")
-
-    def test_running_statuses(self):
-        """Test running statuses return yellow circle."""
-        assert "[yellow]" in _status_icon("running")
-        assert "[yellow]" in _status_icon("in_progress")
-
-    def test_pending_statuses(self):
-        """Test pending statuses return blue circle."""
-        assert "[blue]" in _status_icon("pending")
-        assert "[blue]" in _status_icon("queued")
-        assert "[blue]" in _status_icon("waiting")
-
-    def test_cancelled_statuses(self):
-        """Test cancelled statuses return dim icon."""
-        assert "[dim]" in _status_icon("cancelled")
-        assert "[dim]" in _status_icon("canceled")
-        assert "[dim]" in _status_icon("skipped")
-
-    def test_unknown_status(self):
-        """Test unknown status returns question mark."""
-        result = _status_icon("unknown_status")
-        assert "[dim]?" in result
-
-    def test_case_insensitive(self):
-        """Test status matching is case insensitive."""
-        assert "[green]" in _status_icon("SUCCESS")
-        assert "[green]" in _status_icon("Success")
-        assert "[red]" in _status_icon("FAILED")
+    @pytest.mark.parametrize("status,expected", [
+        # Success statuses return green checkmark
+        ("success", "[green]"),
+        ("passed", "[green]"),
+        ("completed", "[green]"),
+        # Failed statuses return red X
+        ("failed", "[red]"),
+        ("failure", "[red]"),
+        ("error", "[red]"),
+        # Running statuses return yellow circle
+        ("running", "[yellow]"),
+        ("in_progress", "[yellow]"),
+        # Pending statuses return blue circle
+        ("pending", "[blue]"),
+        ("queued", "[blue]"),
+        ("waiting", "[blue]"),
+        # Cancelled statuses return dim icon
+        ("cancelled", "[dim]"),
+        ("canceled", "[dim]"),
+        ("skipped", "[dim]"),
+        # Unknown status returns question mark
+        ("unknown_status", "[dim]?"),
+        # Matching is case insensitive
+        ("SUCCESS", "[green]"),
+        ("Success", "[green]"),
+        ("FAILED", "[red]"),
+    ])
+    def test_status_icon(self, status, expected):
+        """Test each status maps to its icon."""
+        assert expected in _status_icon(status)
 
 
 # ==================== CLI Integration Tests ====================
@@ -134,11 +168,8 @@ class TestStatusIcon:
 class TestCiCLI:
     """CLI integration tests for ci_app."""
 
-    def test_ci_help(self):
+    def test_ci_help(self, runner):
         """Test ci --help shows subcommands."""
-        from typer.testing import CliRunner
-
-        runner = CliRunner()
         result = runner.invoke(ci_app, ["--help"])
 
         assert result.exit_code == 0
@@ -147,89 +178,38 @@ class TestCiCLI:
         assert "trigger" in result.stdout
 
     @patch('redgit.commands.ci._check_cicd')
-    def test_status_shows_integration_name(self, mock_check):
+    def test_status_shows_integration_name(self, mock_check, runner):
         """Test status command shows integration name."""
-        from typer.testing import CliRunner
-
-        mock_cicd = MagicMock()
-        mock_cicd.name = "GitHub Actions"
-        mock_cicd.list_pipelines.return_value = []
-        mock_check.return_value = mock_cicd
+        mock_check.return_value = _stub_cicd()
 
-        runner = CliRunner()
         result = runner.invoke(ci_app, ["status"])
 
         assert result.exit_code == 0
         assert "GitHub Actions" in result.stdout
 
     @patch('redgit.commands.ci._check_cicd')
-    def test_pipelines_shows_table(self, mock_check):
+    def test_pipelines_shows_table(self, mock_check, runner, monkeypatch):
         """Test pipelines command shows table."""
-        from typer.testing import CliRunner
-        from redgit.integrations.base import PipelineRun
-
-        mock_cicd = MagicMock()
-        mock_cicd.list_pipelines.return_value = [
-            PipelineRun(
-                id="12345",
-                name="Build",
-                status="success",
-                branch="main",
-                duration=120
-            )
-        ]
-        mock_check.return_value = mock_cicd
-
-        runner = CliRunner()
-        result = runner.invoke(ci_app, ["pipelines"])
-
-        assert result.exit_code == 0
-        assert "12345" in result.stdout or "main" in result.stdout
-
-    @patch('redgit.commands.ci._check_cicd')
-    def test_pipelines_empty_list(self, mock_check):
-        """Test pipelines command with no pipelines."""
-        from typer.testing import CliRunner
-
-        mock_cicd = MagicMock()
-        mock_cicd.list_pipelines.return_value = []
-        mock_check.return_value = mock_cicd
+        mock_check.return_value = _stub_cicd(pipelines=[_SAMPLE_PIPELINE])
+        captured = []
+        monkeypatch.setattr(console, "print", lambda *args, **kwargs: captured.extend(args))
 
-        runner = CliRunner()
         result = runner.invoke(ci_app, ["pipelines"])
 
         assert result.exit_code == 0
-        assert "No pipelines found" in result.stdout
+        table = next(item for item in captured if isinstance(item, Table))
+        rows = list(zip(*(column.cells for column in table.columns)))
+        assert rows == [("Build", _status_icon("success"), "main", "120s", "-")]
 
     @patch('redgit.commands.ci._check_cicd')
-    def test_pipelines_with_branch_filter(self, mock_check):
-        """Test pipelines command with branch filter."""
-        from typer.testing import CliRunner
-
-        mock_cicd = MagicMock()
-        mock_cicd.list_pipelines.return_value = []
-        mock_check.return_value = mock_cicd
-
-        runner = CliRunner()
-        result = runner.invoke(ci_app, ["pipelines", "--branch", "develop"])
-
-        # Should pass branch to list_pipelines
-        mock_cicd.list_pipelines.assert_called_with(branch="develop", status=None, limit=10)
-
-    @patch('redgit.commands.ci._check_cicd')
-    def test_trigger_calls_cicd(self, mock_check):
+    def test_trigger_calls_cicd(self, mock_check, mock_cicd, runner):
         """Test trigger command calls CI/CD."""
-        from typer.testing import CliRunner
-        from redgit.integrations.base import PipelineRun
-
-        mock_cicd = MagicMock()
-        mock_pipeline = PipelineRun(id="99999", name="Build", status="pending")
-        mock_cicd.trigger_pipeline.return_value = mock_pipeline
+        mock_cicd.trigger_pipeline.return_value = _PENDING_PIPELINE
         mock_check.return_value = mock_cicd
 
-        runner = CliRunner()
         result = runner.invoke(ci_app, ["trigger"])
 
+        assert result.exit_code == 0
         mock_cicd.trigger_pipeline.assert_called()
 
 
@@ -240,42 +220,25 @@ class TestStatusCmd:
 
     @patch('redgit.commands.ci.GitOps')
     @patch('redgit.commands.ci._check_cicd')
-    @patch('redgit.commands.ci.console.print')
-    def test_shows_connected_status(self, mock_print, mock_check, mock_gitops):
+    def test_shows_connected_status(self, mock_check, mock_gitops, printed):
         """Test shows connected status."""
-        from redgit.commands.ci import status_cmd
-
-        mock_cicd = MagicMock()
-        mock_cicd.name = "GitHub Actions"
-        mock_cicd.list_pipelines.return_value = []
-        mock_check.return_value = mock_cicd
+        mock_check.return_value = _stub_cicd()
         mock_gitops.return_value.original_branch = "main"
 
         status_cmd()
 
-        calls = [str(c) for c in mock_print.call_args_list]
-        assert any("Connected" in c for c in calls)
+        assert any("Connected" in line for line in printed)
 
     @patch('redgit.commands.ci.GitOps')
     @patch('redgit.commands.ci._check_cicd')
-    @patch('redgit.commands.ci.console.print')
-    def test_shows_recent_pipelines(self, mock_print, mock_check, mock_gitops):
+    def test_shows_recent_pipelines(self, mock_check, mock_gitops, printed):
         """Test shows recent pipelines."""
-        from redgit.commands.ci import status_cmd
-        from redgit.integrations.base import PipelineRun
-
-        mock_cicd = MagicMock()
-        mock_cicd.name = "GitLab CI"
-        mock_cicd.list_pipelines.return_value = [
-            PipelineRun(id="build-1", name="Build", status="success", branch="main")
-        ]
-        mock_check.return_value = mock_cicd
+        mock_check.return_value = _stub_cicd("GitLab CI", [_SAMPLE_PIPELINE])
         mock_gitops.return_value.original_branch = "main"
 
         status_cmd()
 
-        calls = [str(c) for c in mock_print.call_args_list]
-        assert any("Recent Pipelines" in c for c in calls)
+        assert any("Recent Pipelines" in line for line in printed)
 
 
 # ==================== Tests for list_pipelines ====================
@@ -284,13 +247,8 @@ class TestListPipelines:
     """Tests for list_pipelines function."""
 
     @patch('redgit.commands.ci._check_cicd')
-    @patch('redgit.commands.ci.console.print')
-    def test_uses_limit_option(self, mock_print, mock_check):
+    def test_uses_limit_option(self, mock_check, mock_cicd, printed):
         """Test respects limit option."""
-        from redgit.commands.ci import list_pipelines
-
-        mock_cicd = MagicMock()
-        mock_cicd.list_pipelines.return_value = []
         mock_check.return_value = mock_cicd
 
         list_pipelines(branch=None, status=None, limit=5)
@@ -298,15 +256,28 @@ class TestListPipelines:
         mock_cicd.list_pipelines.assert_called_with(branch=None, status=None, limit=5)
 
     @patch('redgit.commands.ci._check_cicd')
-    @patch('redgit.commands.ci.console.print')
-    def test_uses_status_filter(self, mock_print, mock_check):
+    def test_uses_status_filter(self, mock_check, mock_cicd, printed):
         """Test respects status filter option."""
-        from redgit.commands.ci import list_pipelines
-
-        mock_cicd = MagicMock()
-        mock_cicd.list_pipelines.return_value = []
         mock_check.return_value = mock_cicd
 
         list_pipelines(branch=None, status="success", limit=10)
 
         mock_cicd.list_pipelines.assert_called_with(branch=None, status="success", limit=10)
+
+    @patch('redgit.commands.ci._check_cicd')
+    def test_uses_branch_filter(self, mock_check, mock_cicd, printed):
+        """Test passes branch filter to list_pipelines."""
+        mock_check.return_value = mock_cicd
+
+        list_pipelines(branch="develop", status=None, limit=10)
+
+        mock_cicd.list_pipelines.assert_called_with(branch="develop", status=None, limit=10)
+
+    @patch('redgit.commands.ci._check_cicd')
+    def test_empty_list(self, mock_check, printed):
+        """Test reports when there are no pipelines."""
+        mock_check.return_value = _stub_cicd()
+
+        list_pipelines(branch=None, status=None, limit=10)
+
+        assert any("No pipelines found" in line for line in printed)
@@ -2,7 +2,6 @@
 Unit tests for redgit.core.config module.
 """
 
-import os
 import pytest
 import yaml
 from pathlib import Path
@@ -20,6 +19,53 @@ from redgit.core.config import (
     STATE_PATH,
 )
 
+# Config files for the merge tests, dumped once at import
+WORKFLOW_YAML = yaml.dump({"workflow": {"strategy": "merge-request"}})
+NOTIFICATIONS_YAML = yaml.dump({
+    "notifications": {
+        "enabled": True,
+        "events": {
+            "commit": True,  # Override default False
+            "push": False,   # Override default True
+        }
+    }
+})
+NOTIFICATIONS_OFF_YAML = yaml.dump({
+    "notifications": {
+        "enabled": False,
+        "events": {"push": True}
+    }
+})
+
+
+@pytest.fixture
+def cfg_manager(temp_dir) -> ConfigManager:
+    """Return a ConfigManager rooted at a fresh temporary project directory."""
+    return ConfigManager(root=temp_dir)
+
+
+@pytest.fixture
+def cached_cfg(cfg_manager, monkeypatch) -> ConfigManager:
+    """Return cfg_manager with load() memoized, for tests that only read config."""
+    real_load = cfg_manager.load
+    cache = {}
+
+    def load():
+        if "config" not in cache:
+            cache["config"] = real_load()
+        return cache["config"]
+
+    monkeypatch.setattr(cfg_manager, "load", load)
+    return cfg_manager
+
+
+@pytest.fixture
+def redgit_dir(temp_dir) -> Path:
+    """Create an empty .redgit directory in the temporary project directory."""
+    path = temp_dir / ".redgit"
+    path.mkdir()
+    return path
+
 
 class TestConfigManager:
     """Tests for ConfigManager class."""
@@ -33,183 +79,154 @@ class TestConfigManager:
 
         assert redgit_dir.exists()
 
-    def test_load_returns_empty_dict_when_no_config(self, temp_dir, change_cwd):
+    def test_root_is_used_instead_of_cwd(self, temp_dir, tmp_path, monkeypatch):
+        """Test an explicit root keeps config out of the working directory."""
+        monkeypatch.chdir(tmp_path)
+        manager = ConfigManager(root=temp_dir)
+
+        manager.save({"project": {"name": "Rooted"}})
+
+        assert (temp_dir / ".redgit" / "config.yaml").exists()
+        assert not (tmp_path / ".redgit").exists()
+        assert manager.load()["project"]["name"] == "Rooted"
+
+    def test_load_returns_empty_dict_when_no_config(self, cfg_manager):
         """Test load returns empty dict with defaults when no config exists."""
-        manager = ConfigManager()
-        config = manager.load()
+        config = cfg_manager.load()
 
         assert isinstance(config, dict)
         assert "workflow" in config
         assert config["workflow"]["strategy"] == "local-merge"
 
-    def test_load_returns_config_from_file(self, config_file, change_cwd, temp_dir):
+    def test_load_returns_config_from_file(self, config_file, temp_dir):
         """Test load returns config from file."""
-        os.chdir(temp_dir)
-        manager = ConfigManager()
+        manager = ConfigManager(root=temp_dir)
         config = manager.load()
 
         assert config["project"]["name"] == "TestProject"
         assert config["llm"]["provider"] == "ollama"
 
-    def test_load_merges_workflow_defaults(self, temp_dir, change_cwd):
+    def test_load_merges_workflow_defaults(self, redgit_dir):
         """Test that missing workflow keys are filled with defaults."""
-        redgit_dir = temp_dir / ".redgit"
-        redgit_dir.mkdir()
         config_path = redgit_dir / "config.yaml"
-        config_path.write_text(yaml.dump({"workflow": {"strategy": "merge-request"}}))
+        config_path.write_text(WORKFLOW_YAML)
 
-        manager = ConfigManager()
+        manager = ConfigManager(root=redgit_dir.parent)
         config = manager.load()
 
         assert config["workflow"]["strategy"] == "merge-request"
         assert config["workflow"]["auto_transition"] == True
         assert config["workflow"]["create_missing_issues"] == "ask"
 
-    def test_save_writes_config_file(self, temp_dir, change_cwd):
+    def test_save_writes_config_file(self, temp_dir, cfg_manager):
         """Test save writes config to file."""
-        manager = ConfigManager()
         test_config = {"project": {"name": "SaveTest"}, "version": "1.0.0"}
 
-        manager.save(test_config)
+        cfg_manager.save(test_config)
 
         saved = yaml.safe_load((temp_dir / ".redgit" / "config.yaml").read_text())
         assert saved["project"]["name"] == "SaveTest"
         assert saved["version"] == "1.0.0"
 
-    def test_get_active_integration_returns_none_when_not_set(self, temp_dir, change_cwd):
+    def test_get_active_integration_returns_none_when_not_set(self, cached_cfg):
         """Test get_active_integration returns None when not configured."""
-        manager = ConfigManager()
-
-        result = manager.get_active_integration("task_management")
+        result = cached_cfg.get_active_integration("task_management")
 
         assert result is None
 
-    def test_get_active_integration_returns_configured_value(self, config_file, change_cwd, temp_dir):
+    def test_get_active_integration_returns_configured_value(self, config_file, temp_dir):
         """Test get_active_integration returns configured integration."""
-        os.chdir(temp_dir)
-
         # Update config with active integration
         config = yaml.safe_load(config_file.read_text())
         config["active"] = {"task_management": "jira"}
         config_file.write_text(yaml.dump(config))
 
-        manager = ConfigManager()
+        manager = ConfigManager(root=temp_dir)
         result = manager.get_active_integration("task_management")
 
         assert result == "jira"
 
-    def test_set_active_integration_creates_active_section(self, temp_dir, change_cwd):
+    def test_set_active_integration_creates_active_section(self, cfg_manager):
         """Test set_active_integration creates active section if missing."""
-        manager = ConfigManager()
+        config = cfg_manager.set_active_integration("task_management", "linear")
 
-        manager.set_active_integration("task_management", "linear")
-
-        config = manager.load()
         assert config["active"]["task_management"] == "linear"
 
-    def test_get_notifications_config_returns_defaults(self, temp_dir, change_cwd):
+    def test_get_notifications_config_returns_defaults(self, cached_cfg):
         """Test get_notifications_config returns defaults when not configured."""
-        manager = ConfigManager()
-        notifications = manager.get_notifications_config()
+        notifications = cached_cfg.get_notifications_config()
 
         assert notifications["enabled"] == True
         assert notifications["events"]["push"] == True
         assert notifications["events"]["commit"] == False
 
-    def test_get_notifications_config_merges_with_defaults(self, temp_dir, change_cwd):
+    def test_get_notifications_config_merges_with_defaults(self, redgit_dir):
         """Test get_notifications_config merges user config with defaults."""
-        redgit_dir = temp_dir / ".redgit"
-        redgit_dir.mkdir()
         config_path = redgit_dir / "config.yaml"
-        config_path.write_text(yaml.dump({
-            "notifications": {
-                "enabled": True,
-                "events": {
-                    "commit": True,  # Override default False
-                    "push": False,   # Override default True
-                }
-            }
-        }))
+        config_path.write_text(NOTIFICATIONS_YAML)
 
-        manager = ConfigManager()
+        manager = ConfigManager(root=redgit_dir.parent)
         notifications = manager.get_notifications_config()
 
         assert notifications["events"]["commit"] == True
         assert notifications["events"]["push"] == False
         assert notifications["events"]["pr_created"] == True  # Default preserved
 
-    def test_is_notification_enabled_respects_master_switch(self, temp_dir, change_cwd):
+    def test_is_notification_enabled_respects_master_switch(self, redgit_dir):
         """Test is_notification_enabled returns False when master switch is off."""
-        redgit_dir = temp_dir / ".redgit"
-        redgit_dir.mkdir()
         config_path = redgit_dir / "config.yaml"
-        config_path.write_text(yaml.dump({
-            "notifications": {
-                "enabled": False,
-                "events": {"push": True}
-            }
-        }))
+        config_path.write_text(NOTIFICATIONS_OFF_YAML)
 
-        manager = ConfigManager()
+        manager = ConfigManager(root=redgit_dir.parent)
 
         assert manager.is_notification_enabled("push") == False
 
-    def test_is_notification_enabled_returns_event_status(self, temp_dir, change_cwd):
+    def test_is_notification_enabled_returns_event_status(self, cached_cfg):
         """Test is_notification_enabled returns correct event status."""
-        manager = ConfigManager()
-
-        assert manager.is_notification_enabled("push") == True
-        assert manager.is_notification_enabled("commit") == False
+        assert cached_cfg.is_notification_enabled("push") == True
+        assert cached_cfg.is_notification_enabled("commit") == False
 
-    def test_get_value_returns_nested_value(self, config_file, change_cwd, temp_dir):
+    def test_get_value_returns_nested_value(self, config_file, temp_dir):
         """Test get_value returns nested config value by dot notation."""
-        os.chdir(temp_dir)
-        manager = ConfigManager()
+        manager = ConfigManager(root=temp_dir)
 
         result = manager.get_value("llm.provider")
 
         assert result == "ollama"
 
-    def test_get_value_returns_none_for_missing_path(self, temp_dir, change_cwd):
+    def test_get_value_returns_none_for_missing_path(self, cached_cfg):
         """Test get_value returns None for non-existent path."""
-        manager = ConfigManager()
-
-        result = manager.get_value("non.existent.path")
+        result = cached_cfg.get_value("non.existent.path")
 
         assert result is None
 
-    def test_set_value_creates_nested_structure(self, temp_dir, change_cwd):
+    def test_set_value_creates_nested_structure(self, cfg_manager):
         """Test set_value creates nested structure if needed."""
-        manager = ConfigManager()
+        cfg_manager.set_value("integrations.jira.enabled", True)
 
-        manager.set_value("integrations.jira.enabled", True)
-
-        config = manager.load()
+        config = cfg_manager.load()
         assert config["integrations"]["jira"]["enabled"] == True
 
-    def test_set_value_updates_existing_value(self, config_file, change_cwd, temp_dir):
+    def test_set_value_updates_existing_value(self, config_file, temp_dir):
         """Test set_value updates existing nested value."""
-        os.chdir(temp_dir)
-        manager = ConfigManager()
+        manager = ConfigManager(root=temp_dir)
 
         manager.set_value("llm.timeout", 600)
 
         config = manager.load()
         assert config["llm"]["timeout"] == 600
 
-    def test_get_quality_config_returns_defaults(self, temp_dir, change_cwd):
+    def test_get_quality_config_returns_defaults(self, cached_cfg):
         """Test get_quality_config returns defaults when not configured."""
-        manager = ConfigManager()
-        quality = manager.get_quality_config()
+        quality = cached_cfg.get_quality_config()
 
         assert quality["enabled"] == False
         assert quality["threshold"] == 70
         assert quality["fail_on_security"] == True
 
-    def test_get_semgrep_config_returns_defaults(self, temp_dir, change_cwd):
+    def test_get_semgrep_config_returns_defaults(self, cached_cfg):
         """Test get_semgrep_config returns defaults when not configured."""
-        manager = ConfigManager()
-        semgrep = manager.get_semgrep_config()
+        semgrep = cached_cfg.get_semgrep_config()
 
         assert semgrep["enabled"] == False
         assert semgrep["configs"] == ["auto"]
@@ -269,16 +286,17 @@ class TestStateManager:
         assert result["branch"] == "feature/test"
         assert result["issue_key"] == "PROJ-123"
 
-    def test_set_session_creates_session(self, temp_dir, change_cwd):
-        """Test saving session via save method."""
+    def test_set_base_branch_creates_session(self, temp_dir, change_cwd, monkeypatch):
+        """Test set_base_branch starts a session when none exists."""
         manager = StateManager()
-        session_data = {"branch": "feature/new", "issue_key": "PROJ-456"}
+        saved = []
+        monkeypatch.setattr(manager, "save", saved.append)
 
-        # Use save method directly to set session
-        manager.save({"session": session_data})
+        manager.set_base_branch("feature/new")
 
-        state = manager.load()
-        assert state["session"]["branch"] == "feature/new"
+        assert saved == [{
+            "session": {"base_branch": "feature/new", "branches": [], "issues": []}
+        }]
 
     def test_clear_session_removes_session(self, temp_dir, change_cwd):
         """Test clear_session removes session data."""
@@ -294,85 +312,33 @@ class TestStateManager:
 class TestDefaultConfigs:
     """Tests for default configuration values."""
 
-    def test_default_workflow_has_required_keys(self):
-        """Test DEFAULT_WORKFLOW has all required keys."""
-        required_keys = ["strategy", "auto_transition", "create_missing_issues", "default_issue_type"]
-        for key in required_keys:
-            assert key in DEFAULT_WORKFLOW
-
-    def test_default_notifications_has_required_keys(self):
-        """Test DEFAULT_NOTIFICATIONS has all required keys."""
-        assert "enabled" in DEFAULT_NOTIFICATIONS
-        assert "events" in DEFAULT_NOTIFICATIONS
-        assert "push" in DEFAULT_NOTIFICATIONS["events"]
-        assert "commit" in DEFAULT_NOTIFICATIONS["events"]
-
-    def test_default_quality_has_required_keys(self):
-        """Test DEFAULT_QUALITY has all required keys."""
-        required_keys = ["enabled", "threshold", "fail_on_security", "prompt_file"]
-        for key in required_keys:
-            assert key in DEFAULT_QUALITY
-
-    def test_default_semgrep_has_required_keys(self):
-        """Test DEFAULT_SEMGREP has all required keys."""
-        required_keys = ["enabled", "configs", "severity", "exclude", "timeout"]
-        for key in required_keys:
-            assert key in DEFAULT_SEMGREP
+    @pytest.mark.parametrize("defaults,required_keys", [
+        (DEFAULT_WORKFLOW, ["strategy", "auto_transition", "create_missing_issues", "default_issue_type"]),
+        (DEFAULT_NOTIFICATIONS, ["enabled", "events"]),
+        (DEFAULT_NOTIFICATIONS["events"], ["push", "commit"]),
+        (DEFAULT_QUALITY, ["enabled", "threshold", "fail_on_security", "prompt_file"]),
+        (DEFAULT_SEMGREP, ["enabled", "configs", "severity", "exclude", "timeout"]),
+    ], ids=["workflow", "notifications", "notification_events", "quality", "semgrep"])
+    def test_defaults_have_required_keys(self, defaults, required_keys):
+        """Test each default config dict has all required keys."""
+        assert set(required_keys) <= defaults.keys()
 
 
 class TestValueParsing:
     """Tests for value parsing in set_value."""
 
-    def test_set_value_parses_boolean_true(self, temp_dir, change_cwd):
-        """Test set_value parses 'true' as boolean True."""
-        manager = ConfigManager()
-
-        manager.set_value("test.enabled", "true")
-
-        config = manager.load()
-        assert config["test"]["enabled"] is True
-
-    def test_set_value_parses_boolean_false(self, temp_dir, change_cwd):
-        """Test set_value parses 'false' as boolean False."""
-        manager = ConfigManager()
-
-        manager.set_value("test.enabled", "false")
-
-        config = manager.load()
-        assert config["test"]["enabled"] is False
-
-    def test_set_value_parses_integer(self, temp_dir, change_cwd):
-        """Test set_value parses numeric strings as integers."""
-        manager = ConfigManager()
-
-        manager.set_value("test.count", "42")
-
-        config = manager.load()
-        assert config["test"]["count"] == 42
-
-    def test_set_value_parses_float(self, temp_dir, change_cwd):
-        """Test set_value parses decimal strings as floats."""
-        manager = ConfigManager()
-
-        manager.set_value("test.ratio", "3.14")
-
-        config = manager.load()
-        assert config["test"]["ratio"] == 3.14
-
-    def test_set_value_parses_none(self, temp_dir, change_cwd):
-        """Test set_value parses 'none' as None."""
-        manager = ConfigManager()
-
-        manager.set_value("test.value", "none")
-
-        config = manager.load()
-        assert config["test"]["value"] is None
-
-    def test_set_value_preserves_strings(self, temp_dir, change_cwd):
-        """Test set_value preserves regular strings."""
-        manager = ConfigManager()
-
-        manager.set_value("test.name", "my-project")
-
-        config = manager.load()
-        assert config["test"]["name"] == "my-project"
\ No newline at end of file
+    @pytest.mark.parametrize("raw,expected", [
+        ("true", True),
+        ("false", False),
+        ("42", 42),
+        ("3.14", 3.14),
+        ("none", None),
+        ("my-project", "my-project"),
+    ])
+    def test_set_value_parses_value(self, cfg_manager, raw, expected):
+        """Test set_value converts booleans, numbers and none, and keeps other strings."""
+        cfg_manager.set_value("test.value", raw)
+
+        value = cfg_manager.load()["test"]["value"]
+        assert value == expected
+        assert type(value) is type(expected)
\ No newline at end of file
@@ -4,18 +4,48 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import subprocess
+import typer
 
+from redgit.cli import app
+from redgit.commands import init as init_mod
 from redgit.commands.init import (
     get_builtin_prompts,
     copy_prompts,
     check_semgrep_installed,
     install_semgrep,
+    select_llm_provider,
+    select_plugins,
+    select_semgrep_settings,
+    select_quality_settings,
+    init_cmd,
     PROMPT_CATEGORIES,
     PACKAGE_DIR,
     BUILTIN_PROMPTS_DIR,
 )
 
 
+@pytest.fixture
+def mock_run(monkeypatch):
+    """Replace subprocess.run with a mock and silence typer.echo."""
+    run = MagicMock()
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(typer, "echo", lambda *args, **kwargs: None)
+    return run
+
+
+@pytest.fixture(scope="module")
+def claude_providers():
+    """Provider registry with only Claude Code, as returned by load_providers."""
+    return {
+        "claude-code": {
+            "name": "Claude Code",
+            "type": "cli",
+            "models": ["claude-sonnet-4-20250514"],
+            "default_model": "claude-sonnet-4-20250514"
+        }
+    }
+
+
 # ==================== Tests for get_builtin_prompts ====================
 
 class TestGetBuiltinPrompts:
@@ -72,8 +102,8 @@ class TestCopyPrompts:
         dest_dir.mkdir()
 
         # Patch the paths
-        monkeypatch.setattr("redgit.commands.init.BUILTIN_PROMPTS_DIR", src_prompts)
-        monkeypatch.setattr("redgit.commands.init.RETGIT_DIR", dest_dir)
+        monkeypatch.setattr(init_mod, "BUILTIN_PROMPTS_DIR", src_prompts)
+        monkeypatch.setattr(init_mod, "RETGIT_DIR", dest_dir)
 
         result = copy_prompts()
 
@@ -91,32 +121,19 @@ class TestCopyPrompts:
 class TestCheckSemgrepInstalled:
     """Tests for check_semgrep_installed function."""
 
-    @patch('subprocess.run')
-    def test_returns_true_when_installed(self, mock_run):
-        """Test returns True when semgrep is installed."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        result = check_semgrep_installed()
-
-        assert result is True
+    @pytest.mark.parametrize("run_effect,expected", [
+        pytest.param(MagicMock(returncode=0), True, id="installed"),
+        pytest.param(MagicMock(returncode=1), False, id="command-fails"),
+        pytest.param(FileNotFoundError("semgrep not found"), False, id="not-found"),
+    ])
+    def test_reports_installation(self, mock_run, run_effect, expected):
+        """Test returns whether semgrep --version succeeds."""
+        if isinstance(run_effect, BaseException):
+            mock_run.side_effect = run_effect
+        else:
+            mock_run.return_value = run_effect
 
-    @patch('subprocess.run')
-    def test_returns_false_when_not_installed(self, mock_run):
-        """Test returns False when semgrep fails."""
-        mock_run.return_value = MagicMock(returncode=1)
-
-        result = check_semgrep_installed()
-
-        assert result is False
-
-    @patch('subprocess.run')
-    def test_returns_false_when_file_not_found(self, mock_run):
-        """Test returns False when semgrep not found."""
-        mock_run.side_effect = FileNotFoundError("semgrep not found")
-
-        result = check_semgrep_installed()
-
-        assert result is False
+        assert check_semgrep_installed() is expected
 
 
 # ==================== Tests for install_semgrep ====================
@@ -124,30 +141,21 @@ class TestCheckSemgrepInstalled:
 class TestInstallSemgrep:
     """Tests for install_semgrep function."""
 
-    @patch('subprocess.run')
-    @patch('typer.echo')
-    def test_returns_true_on_success(self, mock_echo, mock_run):
-        """Test returns True on successful installation."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        result = install_semgrep()
-
-        assert result is True
+    @pytest.mark.parametrize("run_effect,expected", [
+        pytest.param(MagicMock(returncode=0), True, id="success"),
+        pytest.param(subprocess.CalledProcessError(1, "pip install"), False, id="failure"),
+    ])
+    def test_reports_install_result(self, mock_run, run_effect, expected):
+        """Test returns whether pip install succeeded."""
+        if isinstance(run_effect, BaseException):
+            mock_run.side_effect = run_effect
+        else:
+            mock_run.return_value = run_effect
+
+        assert install_semgrep() is expected
         mock_run.assert_called_once()
 
-    @patch('subprocess.run')
-    @patch('typer.echo')
-    def test_returns_false_on_failure(self, mock_echo, mock_run):
-        """Test returns False on installation failure."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "pip install")
-
-        result = install_semgrep()
-
-        assert result is False
-
-    @patch('subprocess.run')
-    @patch('typer.echo')
-    def test_calls_pip_install(self, mock_echo, mock_run):
+    def test_calls_pip_install(self, mock_run):
         """Test calls pip install semgrep."""
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -167,18 +175,9 @@ class TestSelectLLMProvider:
     @patch('redgit.commands.init.typer.echo')
     @patch('redgit.commands.init.check_provider_available')
     @patch('redgit.commands.init.load_providers')
-    def test_returns_tuple(self, mock_load, mock_check, mock_echo, mock_prompt):
+    def test_returns_tuple(self, mock_load, mock_check, mock_echo, mock_prompt, claude_providers):
         """Test returns tuple of (provider, model, api_key)."""
-        from redgit.commands.init import select_llm_provider
-
-        mock_load.return_value = {
-            "claude-code": {
-                "name": "Claude Code",
-                "type": "cli",
-                "models": ["claude-sonnet-4-20250514"],
-                "default_model": "claude-sonnet-4-20250514"
-            }
-        }
+        mock_load.return_value = claude_providers
         mock_check.return_value = True
         mock_prompt.side_effect = ["claude-code", "claude-sonnet-4-20250514"]
 
@@ -191,20 +190,13 @@ class TestSelectLLMProvider:
     @patch('redgit.commands.init.typer.echo')
     @patch('redgit.commands.init.check_provider_available')
     @patch('redgit.commands.init.load_providers')
-    def test_defaults_to_claude_code_for_unknown(self, mock_load, mock_check, mock_echo, mock_prompt):
+    def test_defaults_to_claude_code_for_unknown(
+        self, mock_load, mock_check, mock_echo, mock_prompt, claude_providers
+    ):
         """Test defaults to claude-code for unknown provider."""
-        from redgit.commands.init import select_llm_provider
-
-        mock_load.return_value = {
-            "claude-code": {
-                "name": "Claude Code",
-                "type": "cli",
-                "models": ["model1"],
-                "default_model": "model1"
-            }
-        }
+        mock_load.return_value = claude_providers
         mock_check.return_value = True
-        mock_prompt.side_effect = ["unknown-provider", "model1"]
+        mock_prompt.side_effect = ["unknown-provider", "claude-sonnet-4-20250514"]
 
         provider, model, _ = select_llm_provider()
 
@@ -216,73 +208,36 @@ class TestSelectLLMProvider:
 class TestSelectPlugins:
     """Tests for select_plugins function."""
 
-    @patch('redgit.commands.init.typer.confirm')
-    @patch('redgit.commands.init.typer.echo')
-    @patch('redgit.commands.init.detect_project_type')
-    @patch('redgit.commands.init.get_builtin_plugins')
-    def test_returns_empty_when_no_plugins(self, mock_builtin, mock_detect, mock_echo, mock_confirm):
-        """Test returns empty list when no plugins available."""
-        from redgit.commands.init import select_plugins
-
-        mock_builtin.return_value = []
-
-        result = select_plugins()
-
-        assert result == []
-
-    @patch('redgit.commands.init.typer.confirm')
-    @patch('redgit.commands.init.typer.echo')
-    @patch('redgit.commands.init.detect_project_type')
-    @patch('redgit.commands.init.get_builtin_plugins')
-    def test_returns_empty_when_user_declines(self, mock_builtin, mock_detect, mock_echo, mock_confirm):
-        """Test returns empty list when user declines plugins."""
-        from redgit.commands.init import select_plugins
-
-        mock_builtin.return_value = ["laravel", "django"]
-        mock_detect.return_value = ["laravel"]
-        mock_confirm.return_value = False
-
-        result = select_plugins()
-
-        assert result == []
-
+    @pytest.mark.parametrize("builtin,detected,confirm,prompt_input,expected", [
+        pytest.param([], [], False, None, [], id="no-plugins"),
+        pytest.param(["laravel", "django"], ["laravel"], False, None, [], id="declined"),
+        pytest.param(["laravel", "django"], [], True, "all", ["laravel", "django"], id="all"),
+        pytest.param(
+            ["laravel", "django", "rails"], [], True, "laravel, django", ["laravel", "django"],
+            id="selected",
+        ),
+    ])
     @patch('redgit.commands.init.typer.prompt')
     @patch('redgit.commands.init.typer.confirm')
     @patch('redgit.commands.init.typer.echo')
     @patch('redgit.commands.init.detect_project_type')
     @patch('redgit.commands.init.get_builtin_plugins')
-    def test_returns_all_plugins(self, mock_builtin, mock_detect, mock_echo, mock_confirm, mock_prompt):
-        """Test returns all plugins when 'all' selected."""
-        from redgit.commands.init import select_plugins
-
-        mock_builtin.return_value = ["laravel", "django"]
-        mock_detect.return_value = []
-        mock_confirm.return_value = True
-        mock_prompt.return_value = "all"
-
-        result = select_plugins()
-
-        assert result == ["laravel", "django"]
-
-    @patch('redgit.commands.init.typer.prompt')
-    @patch('redgit.commands.init.typer.confirm')
-    @patch('redgit.commands.init.typer.echo')
-    @patch('redgit.commands.init.detect_project_type')
-    @patch('redgit.commands.init.get_builtin_plugins')
-    def test_returns_selected_plugins(self, mock_builtin, mock_detect, mock_echo, mock_confirm, mock_prompt):
-        """Test returns selected plugins from comma-separated list."""
-        from redgit.commands.init import select_plugins
-
-        mock_builtin.return_value = ["laravel", "django", "rails"]
-        mock_detect.return_value = []
-        mock_confirm.return_value = True
-        mock_prompt.return_value = "laravel, django"
+    def test_returns_chosen_plugins(
+        self, mock_builtin, mock_detect, mock_echo, mock_confirm, mock_prompt,
+        builtin, detected, confirm, prompt_input, expected
+    ):
+        """Test returns the plugins the user picks from those available."""
+        mock_builtin.return_value = builtin
+        mock_detect.return_value = detected
+        mock_confirm.return_value = confirm
+        if prompt_input is not None:
+            mock_prompt.return_value = prompt_input
 
         result = select_plugins()
 
-        assert "laravel" in result
-        assert "django" in result
-        assert "rails" not in result
+        assert result == expected
+        if prompt_input is None:
+            mock_prompt.assert_not_called()
 
 
 # ==================== Tests for select_semgrep_settings ====================
@@ -290,52 +245,33 @@ class TestSelectPlugins:
 class TestSelectSemgrepSettings:
     """Tests for select_semgrep_settings function."""
 
-    @patch('redgit.commands.init.typer.confirm')
-    @patch('redgit.commands.init.typer.echo')
-    def test_returns_disabled_when_declined(self, mock_echo, mock_confirm):
-        """Test returns disabled config when user declines."""
-        from redgit.commands.init import select_semgrep_settings
-
-        mock_confirm.return_value = False
-
-        result = select_semgrep_settings()
-
-        assert result["enabled"] is False
-
-    @patch('redgit.commands.init.typer.prompt')
-    @patch('redgit.commands.init.typer.confirm')
-    @patch('redgit.commands.init.typer.echo')
-    @patch('redgit.commands.init.check_semgrep_installed')
-    def test_returns_enabled_config(self, mock_check, mock_echo, mock_confirm, mock_prompt):
-        """Test returns enabled config with settings."""
-        from redgit.commands.init import select_semgrep_settings
-
-        mock_confirm.return_value = True
-        mock_check.return_value = True
-        mock_prompt.return_value = "auto, p/security-audit"
-
-        result = select_semgrep_settings()
-
-        assert result["enabled"] is True
-        assert "auto" in result["configs"]
-
+    @pytest.mark.parametrize("confirm_seq,installed,prompt_ret,expect_install,expect_enabled", [
+        pytest.param([False], True, None, False, False, id="declined"),
+        pytest.param([True], True, "auto, p/security-audit", False, True, id="enabled"),
+        pytest.param([True, True], False, "auto", True, True, id="installs-if-missing"),
+        pytest.param([True, False], False, None, False, False, id="install-declined"),
+    ])
     @patch('redgit.commands.init.typer.prompt')
     @patch('redgit.commands.init.typer.confirm')
     @patch('redgit.commands.init.typer.echo')
     @patch('redgit.commands.init.install_semgrep')
     @patch('redgit.commands.init.check_semgrep_installed')
-    def test_installs_semgrep_if_missing(self, mock_check, mock_install, mock_echo, mock_confirm, mock_prompt):
-        """Test offers to install semgrep if missing."""
-        from redgit.commands.init import select_semgrep_settings
-
-        mock_check.return_value = False
-        mock_confirm.side_effect = [True, True]  # Enable, then install
+    def test_select_semgrep_settings(
+        self, mock_check, mock_install, mock_echo, mock_confirm, mock_prompt,
+        confirm_seq, installed, prompt_ret, expect_install, expect_enabled
+    ):
+        """Test enabling, declining and installing Semgrep from the wizard."""
+        mock_confirm.side_effect = confirm_seq  # Enable, then install if missing
+        mock_check.return_value = installed
         mock_install.return_value = True
-        mock_prompt.return_value = "auto"
+        mock_prompt.return_value = prompt_ret
 
         result = select_semgrep_settings()
 
-        mock_install.assert_called_once()
+        assert result["enabled"] is expect_enabled
+        assert mock_install.called == expect_install
+        if expect_enabled:
+            assert "auto" in result["configs"]
 
 
 # ==================== Tests for select_quality_settings ====================
@@ -347,8 +283,6 @@ class TestSelectQualitySettings:
     @patch('redgit.commands.init.typer.echo')
     def test_returns_disabled_when_declined(self, mock_echo, mock_confirm):
         """Test returns disabled config when user declines."""
-        from redgit.commands.init import select_quality_settings
-
         mock_confirm.return_value = False
 
         result = select_quality_settings()
@@ -360,8 +294,6 @@ class TestSelectQualitySettings:
     @patch('redgit.commands.init.typer.echo')
     def test_returns_enabled_config_with_threshold(self, mock_echo, mock_confirm, mock_prompt):
         """Test returns enabled config with threshold."""
-        from redgit.commands.init import select_quality_settings
-
         mock_confirm.side_effect = [True, True]  # Enable, fail on security
         mock_prompt.return_value = 80
 
@@ -371,33 +303,24 @@ class TestSelectQualitySettings:
         assert result["threshold"] == 80
         assert result["fail_on_security"] is True
 
+    @pytest.mark.parametrize("input_val,expected", [
+        (150, 100),  # Over 100
+        (-10, 0),    # Negative
+        (50, 50),
+        (0, 0),
+        (100, 100),
+    ])
     @patch('redgit.commands.init.typer.prompt')
     @patch('redgit.commands.init.typer.confirm')
     @patch('redgit.commands.init.typer.echo')
-    def test_clamps_threshold_to_valid_range(self, mock_echo, mock_confirm, mock_prompt):
+    def test_clamps_threshold(self, mock_echo, mock_confirm, mock_prompt, input_val, expected):
         """Test clamps threshold to 0-100 range."""
-        from redgit.commands.init import select_quality_settings
-
         mock_confirm.side_effect = [True, False]
-        mock_prompt.return_value = 150  # Over 100
+        mock_prompt.return_value = input_val
 
         result = select_quality_settings()
 
-        assert result["threshold"] == 100
-
-    @patch('redgit.commands.init.typer.prompt')
-    @patch('redgit.commands.init.typer.confirm')
-    @patch('redgit.commands.init.typer.echo')
-    def test_clamps_negative_threshold(self, mock_echo, mock_confirm, mock_prompt):
-        """Test clamps negative threshold to 0."""
-        from redgit.commands.init import select_quality_settings
-
-        mock_confirm.side_effect = [True, False]
-        mock_prompt.return_value = -10  # Negative
-
-        result = select_quality_settings()
-
-        assert result["threshold"] == 0
+        assert result["threshold"] == expected
 
 
 # ==================== Tests for init_cmd CLI ====================
@@ -405,12 +328,8 @@ class TestSelectQualitySettings:
 class TestInitCmdCLI:
     """CLI tests for init_cmd."""
 
-    def test_init_help(self):
+    def test_init_help(self, runner):
         """Test init command help."""
-        from typer.testing import CliRunner
-        from redgit.cli import app
-
-        runner = CliRunner()
         result = runner.invoke(app, ["init", "--help"])
 
         assert result.exit_code == 0
@@ -425,13 +344,9 @@ class TestInitCmdCLI:
     @patch('redgit.commands.init.RETGIT_DIR')
     def test_init_creates_config(
         self, mock_dir, mock_config, mock_copy,
-        mock_llm, mock_plugins, mock_quality, mock_semgrep
+        mock_llm, mock_plugins, mock_quality, mock_semgrep, runner
     ):
         """Test init creates configuration."""
-        from typer.testing import CliRunner
-        from redgit.commands.init import init_cmd
-        import typer
-
         mock_dir.mkdir = MagicMock()
         mock_config.return_value.save = MagicMock()
         mock_copy.return_value = 3
@@ -443,7 +358,6 @@ class TestInitCmdCLI:
         test_app = typer.Typer()
         test_app.command()(init_cmd)
 
-        runner = CliRunner()
         result = runner.invoke(test_app, input="test-project\n")
 
         # Config should be saved
@@ -0,0 +1,569 @@
+"""
+Unit tests for redgit.integrations.registry module.
+"""
+
+import sys
+
+import pytest
+from pathlib import Path
+
+from redgit.integrations import registry
+from redgit.integrations.base import IntegrationType, NotificationBase
+
+
+INTEGRATION_SOURCE = '''
+from redgit.integrations.base import NotificationBase
+
+
+class {class_name}(NotificationBase):
+    name = "{name}"
+    origin = "{origin}"
+
+    def setup(self, config):
+        self.enabled = config.get("enabled", False)
+
+    def send_message(self, message, channel=None):
+        return True
+'''
+
+
+def _write_integration(directory: Path, name: str, package: bool = False) -> Path:
+    """Write a minimal notification integration into directory."""
+    class_name = "".join(word.capitalize() for word in name.split("_")) + "Integration"
+    source = INTEGRATION_SOURCE.format(class_name=class_name, name=name, origin=directory.name)
+    if package:
+        path = directory / name / "__init__.py"
+        path.parent.mkdir(parents=True)
+    else:
+        path = directory / f"{name}.py"
+    path.write_text(source)
+    return path
+
+
+@pytest.fixture
+def custom_dirs(temp_dir, monkeypatch):
+    """Point global and project integration dirs at a temp directory."""
+    global_dir = temp_dir / "global"
+    project_dir = temp_dir / "project"
+    global_dir.mkdir()
+    project_dir.mkdir()
+    monkeypatch.setattr(registry, "GLOBAL_INTEGRATIONS_PATH", global_dir)
+    monkeypatch.setattr(registry, "PROJECT_INTEGRATIONS_DIR", project_dir)
+
+    # Discovery state is patched too, so undoing the patches restores the
+    # real-directory results instead of leaving temp paths behind
+    monkeypatch.setattr(registry, "_discovery_done", False)
+    monkeypatch.setattr(registry, "_integration_locations", {})
+    monkeypatch.setattr(registry, "_integration_cache", {})
+    monkeypatch.setattr(registry, "_integrations_by_type", None)
+    monkeypatch.setattr(registry, "_commands_module_cache", {})
+    monkeypatch.delattr(registry, "BUILTIN_INTEGRATIONS", raising=False)
+    return global_dir, project_dir
+
+
+class TestDiscoverFromDirectory:
+    """Tests for integration discovery."""
+
+    def test_discovers_single_file_integration(self, custom_dirs):
+        """Test name.py integrations are discovered."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+
+        registry.refresh_integrations()
+        cls = registry.get_integration_class("pinger")
+
+        assert cls is not None
+        assert cls.__name__ == "PingerIntegration"
+
+    def test_discovers_package_integration(self, custom_dirs):
+        """Test name/__init__.py integrations are discovered."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "my_hook", package=True)
+
+        registry.refresh_integrations()
+        cls = registry.get_integration_class("my_hook")
+
+        assert cls is not None
+        assert cls.integration_type == IntegrationType.NOTIFICATION
+
+    def test_skips_private_and_reserved_names(self, custom_dirs):
+        """Test underscore-prefixed and reserved names are ignored."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "_hidden")
+        _write_integration(global_dir, "base")
+        (global_dir / "notes.txt").write_text("not an integration")
+
+        registry.refresh_integrations()
+        names = registry.get_builtin_integrations()
+
+        assert "_hidden" not in names
+        assert "base" not in names
+        assert "notes" not in names
+
+    def test_skips_directory_without_init(self, custom_dirs):
+        """Test folders without __init__.py are ignored."""
+        global_dir, _ = custom_dirs
+        (global_dir / "empty_pkg").mkdir()
+
+        registry.refresh_integrations()
+
+        assert registry.get_integration_class("empty_pkg") is None
+
+    def test_discovers_package_init_added_later(self, custom_dirs):
+        """Test a package gains discovery once its __init__.py is written."""
+        global_dir, _ = custom_dirs
+        (global_dir / "late_hook").mkdir()
+        registry.refresh_integrations()
+        assert registry.get_integration_class("late_hook") is None
+
+        (global_dir / "late_hook" / "__init__.py").write_text(
+            INTEGRATION_SOURCE.format(class_name="LateHookIntegration", name="late_hook", origin="global")
+        )
+        registry.refresh_integrations()
+
+        assert registry.get_integration_class("late_hook") is not None
+
+    def test_project_overrides_global(self, custom_dirs):
+        """Test project integrations take precedence over global ones."""
+        global_dir, project_dir = custom_dirs
+        _write_integration(global_dir, "pinger")
+        _write_integration(project_dir, "pinger", package=True)
+
+        registry.refresh_integrations()
+        cls = registry.get_integration_class("pinger")
+
+        assert cls.origin == "project"
+
+    def test_missing_directory_is_ignored(self, custom_dirs):
+        """Test discovery tolerates a missing directory."""
+        global_dir, _ = custom_dirs
+        global_dir.rmdir()
+
+        assert registry._discover_from_directory(global_dir) == []
+
+        registry.refresh_integrations()
+        locations = registry._discover_integrations()
+        assert not any(
+            path.startswith(str(global_dir))
+            for candidates in locations.values()
+            for path, _ in candidates
+        )
+
+
+class TestLazyResolution:
+    """Tests for deferred integration imports."""
+
+    def test_discovery_does_not_import(self, custom_dirs, monkeypatch):
+        """Test discovery only records integration locations."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("module should not be imported")
+
+        with monkeypatch.context() as m:
+            m.setattr(registry, "_load_class_from_file", fail_load)
+            registry.refresh_integrations()
+            assert "pinger" in registry._discover_integrations()
+
+    def test_listing_skips_unloadable(self, custom_dirs):
+        """Test names that fail to import or define no class are not listed."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        (global_dir / "broken.py").write_text("raise RuntimeError('broken')\n")
+        (global_dir / "noclass.py").write_text("VALUE = 1\n")
+        registry.refresh_integrations()
+
+        names = registry.get_builtin_integrations()
+
+        assert "pinger" in names
+        assert "broken" not in names
+        assert "noclass" not in names
+
+    def test_install_schemas_skip_unloadable(self, custom_dirs):
+        """Test install schemas are only listed for loadable integrations."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger", package=True)
+        (global_dir / "pinger" / "install_schema.json").write_text('{"name": "pinger"}')
+        (global_dir / "broken").mkdir()
+        (global_dir / "broken" / "__init__.py").write_text("raise RuntimeError('broken')\n")
+        (global_dir / "broken" / "install_schema.json").write_text('{"name": "broken"}')
+        registry.refresh_integrations()
+
+        schemas = registry.get_all_install_schemas()
+
+        assert schemas["pinger"] == {"name": "pinger"}
+        assert "broken" not in schemas
+
+    def test_resolved_class_is_cached(self, custom_dirs, monkeypatch):
+        """Test a class is imported once and then served from cache."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        first = registry.get_integration_class("pinger")
+        with monkeypatch.context() as m:
+            m.setattr(registry, "_load_class_from_file", lambda *a, **kw: None)
+            assert registry.get_integration_class("pinger") is first
+
+    def test_broken_override_falls_back(self, custom_dirs):
+        """Test a failing project integration falls back to the global one."""
+        global_dir, project_dir = custom_dirs
+        _write_integration(global_dir, "pinger")
+        (project_dir / "pinger.py").write_text("raise RuntimeError('broken')\n")
+
+        registry.refresh_integrations()
+        cls = registry.get_integration_class("pinger")
+
+        assert cls.origin == "global"
+
+    def test_get_all_integrations_skips_broken(self, custom_dirs):
+        """Test integrations that fail to load are left out."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        (global_dir / "broken.py").write_text("raise RuntimeError('broken')\n")
+
+        registry.refresh_integrations()
+        integrations = registry.get_all_integrations()
+
+        assert "pinger" in integrations
+        assert "broken" not in integrations
+
+    def test_custom_module_registered_in_sys_modules(self, custom_dirs):
+        """Test custom integration modules are importable after loading."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+
+        registry.refresh_integrations()
+        cls = registry.get_integration_class("pinger")
+
+        assert sys.modules[cls.__module__].PingerIntegration is cls
+
+    def test_failed_custom_module_is_unregistered(self, custom_dirs):
+        """Test a module that fails to execute is removed from sys.modules."""
+        global_dir, _ = custom_dirs
+        (global_dir / "broken.py").write_text("raise RuntimeError('broken')\n")
+
+        registry.refresh_integrations()
+
+        assert registry.get_integration_class("broken") is None
+        assert "custom_integration_broken" not in sys.modules
+
+    def test_custom_module_without_class_is_unregistered(self, custom_dirs):
+        """Test a module that defines no integration class is removed from sys.modules."""
+        global_dir, _ = custom_dirs
+        (global_dir / "noclass.py").write_text("VALUE = 1\n")
+
+        registry.refresh_integrations()
+
+        assert registry.get_integration_class("noclass") is None
+        assert "custom_integration_noclass" not in sys.modules
+
+
+class TestFindIntegrationClass:
+    """Tests for locating the integration class in a module."""
+
+    def test_prefers_registered_class(self, custom_dirs):
+        """Test @register_integration wins over name guessing."""
+        global_dir, _ = custom_dirs
+        (global_dir / "hooky.py").write_text(
+            "from redgit.integrations.base import NotificationBase, register_integration\n"
+            "\n"
+            "class HookyIntegration(NotificationBase):\n"
+            "    name = 'hooky'\n"
+            "    def send_message(self, message, channel=None):\n"
+            "        return True\n"
+            "\n"
+            "@register_integration\n"
+            "class HookyV2(HookyIntegration):\n"
+            "    pass\n"
+        )
+
+        registry.refresh_integrations()
+
+        assert registry.get_integration_class("hooky").__name__ == "HookyV2"
+
+    def test_matches_unconventional_class_by_name_attribute(self, custom_dirs):
+        """Test classes with irregular names are still found via 'name'."""
+        global_dir, _ = custom_dirs
+        (global_dir / "git_hub.py").write_text(
+            "from redgit.integrations.base import NotificationBase\n"
+            "\n"
+            "class GitHubNotifier(NotificationBase):\n"
+            "    name = 'git-hub'\n"
+            "    def send_message(self, message, channel=None):\n"
+            "        return True\n"
+        )
+
+        registry.refresh_integrations()
+
+        assert registry.get_integration_class("git_hub").__name__ == "GitHubNotifier"
+
+
+class TestLoadIntegrationByName:
+    """Tests for load_integration_by_name."""
+
+    def test_returns_enabled_instance(self, custom_dirs):
+        """Test an enabled integration is set up and returned."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        integration = registry.load_integration_by_name("pinger", {"enabled": True})
+
+        assert integration is not None
+        assert integration.enabled is True
+
+    def test_returns_none_when_disabled(self, custom_dirs):
+        """Test an integration that disables itself in setup is not returned."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        assert registry.load_integration_by_name("pinger", {}) is None
+
+
+class TestIsValidIntegrationClass:
+    """Tests for _is_valid_integration_class."""
+
+    @pytest.mark.parametrize("base", sorted(registry._ABSTRACT_BASES, key=lambda c: c.__name__))
+    def test_rejects_base_classes(self, base):
+        """Test abstract base classes are not integrations."""
+        assert registry._is_valid_integration_class(base) is False
+
+    @pytest.mark.parametrize("value", [None, "JiraIntegration", object, NotificationBase.notify])
+    def test_rejects_non_integrations(self, value):
+        """Test non-class and unrelated values are rejected."""
+        assert registry._is_valid_integration_class(value) is False
+
+    def test_accepts_subclass(self):
+        """Test a concrete subclass is accepted."""
+        class DemoIntegration(NotificationBase):
+            name = "demo"
+
+        assert registry._is_valid_integration_class(DemoIntegration) is True
+
+
+class TestActiveDispatchers:
+    """Tests for the get_* active integration helpers."""
+
+    @pytest.fixture
+    def pinger(self, custom_dirs):
+        """Install the pinger notification integration."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+    def test_returns_active_integration(self, pinger):
+        """Test the configured notification integration is returned."""
+        config = {"active": {"notification": "pinger"}, "integrations": {"pinger": {"enabled": True}}}
+
+        assert registry.get_notification(config).name == "pinger"
+
+    def test_override_name(self, pinger):
+        """Test active_name overrides the config."""
+        config = {"integrations": {"pinger": {"enabled": True}}}
+
+        assert registry.get_notification(config, active_name="pinger") is not None
+
+    def test_wrong_type_returns_none(self, pinger):
+        """Test an integration of another type is rejected."""
+        config = {"active": {"code_hosting": "pinger"}, "integrations": {"pinger": {"enabled": True}}}
+
+        assert registry.get_code_hosting(config) is None
+
+    @pytest.mark.parametrize("active", [None, "none", "None"])
+    def test_unset_returns_none(self, pinger, active):
+        """Test missing or 'none' active names return None."""
+        config = {"active": {"notification": active}, "integrations": {"pinger": {"enabled": True}}}
+
+        assert registry.get_notification(config) is None
+
+    def test_reassigned_active_section_is_seen(self, pinger):
+        """Test replacing config['active'] on the same dict takes effect."""
+        config = {"active": {"notification": "pinger"}, "integrations": {"pinger": {"enabled": True}}}
+        assert registry.get_notification(config) is not None
+
+        config["active"] = {}
+
+        assert registry.get_notification(config) is None
+
+    def test_empty_sections_are_tolerated(self, pinger):
+        """Test 'active:' with no value in YAML does not raise."""
+        assert registry.get_notification({"active": None, "integrations": None}) is None
+
+    def test_explicitly_disabled_returns_none(self, pinger):
+        """Test enabled: false short-circuits loading."""
+        config = {"active": {"notification": "pinger"}, "integrations": {"pinger": {"enabled": False}}}
+
+        assert registry.get_notification(config) is None
+
+
+class TestBuiltinIntegrationsAttribute:
+    """Tests for the lazily built BUILTIN_INTEGRATIONS mapping."""
+
+    def test_maps_names_to_types(self, custom_dirs):
+        """Test the mapping reflects discovered integrations."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        assert registry.BUILTIN_INTEGRATIONS["pinger"] == IntegrationType.NOTIFICATION
+
+    def test_rebuilt_after_refresh(self, custom_dirs):
+        """Test refresh_integrations drops the cached mapping."""
+        global_dir, _ = custom_dirs
+        registry.refresh_integrations()
+        assert "pinger" not in registry.BUILTIN_INTEGRATIONS
+
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        assert "pinger" in registry.BUILTIN_INTEGRATIONS
+
+    def test_unknown_attribute_raises(self):
+        """Test other missing attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            registry.NOT_A_REAL_ATTRIBUTE
+
+
+class TestInstallSchema:
+    """Tests for install schema lookup."""
+
+    def test_reads_global_schema(self, custom_dirs):
+        """Test a tap-installed schema is found."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger", package=True)
+        (global_dir / "pinger" / "install_schema.json").write_text('{"name": "pinger"}')
+
+        assert registry.get_install_schema("pinger") == {"name": "pinger"}
+
+    def test_project_schema_used_when_global_missing(self, custom_dirs):
+        """Test the project directory is checked after global."""
+        _, project_dir = custom_dirs
+        _write_integration(project_dir, "pinger", package=True)
+        (project_dir / "pinger" / "install_schema.json").write_text('{"scope": "project"}')
+
+        assert registry.get_install_schema("pinger") == {"scope": "project"}
+
+    def test_invalid_schema_falls_through(self, custom_dirs):
+        """Test an unparsable schema is skipped."""
+        global_dir, project_dir = custom_dirs
+        (global_dir / "pinger").mkdir()
+        (global_dir / "pinger" / "install_schema.json").write_text("{broken")
+        (project_dir / "pinger").mkdir()
+        (project_dir / "pinger" / "install_schema.json").write_text('{"ok": true}')
+
+        assert registry.get_install_schema("pinger") == {"ok": True}
+
+    def test_stdlib_json_fallback(self, custom_dirs, monkeypatch):
+        """Test schemas parse without orjson installed."""
+        global_dir, _ = custom_dirs
+        (global_dir / "pinger").mkdir()
+        (global_dir / "pinger" / "install_schema.json").write_text('{"fields": [1, 2]}')
+        monkeypatch.setattr(registry, "HAS_ORJSON", False)
+
+        assert registry.get_install_schema("pinger") == {"fields": [1, 2]}
+
+    def test_missing_schema_returns_none(self, custom_dirs):
+        """Test None is returned when no schema exists."""
+        assert registry.get_install_schema("nothing_here") is None
+
+
+COMMANDS_SOURCE = '''
+import typer
+
+pinger_app = typer.Typer(help="Pinger commands")
+'''
+
+
+class TestIntegrationCommands:
+    """Tests for integration command discovery."""
+
+    def test_loads_global_commands(self, custom_dirs):
+        """Test commands.py next to a tap-installed integration is used."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger", package=True)
+        (global_dir / "pinger" / "commands.py").write_text(COMMANDS_SOURCE)
+        registry.refresh_integrations()
+
+        app = registry.get_integration_commands("pinger")
+
+        assert app is not None
+        assert app.info.help == "Pinger commands"
+
+    def test_result_is_cached(self, custom_dirs, monkeypatch):
+        """Test a second lookup does not search again."""
+        registry.refresh_integrations()
+        assert registry.get_integration_commands("pinger") is None
+
+        with monkeypatch.context() as m:
+            m.setattr(registry, "_find_integration_commands", lambda name: pytest.fail("searched again"))
+            assert registry.get_integration_commands("pinger") is None
+
+    def test_refresh_clears_cached_miss(self, custom_dirs):
+        """Test commands installed later are found after refresh."""
+        global_dir, _ = custom_dirs
+        registry.refresh_integrations()
+        assert registry.get_integration_commands("pinger") is None
+
+        _write_integration(global_dir, "pinger", package=True)
+        (global_dir / "pinger" / "commands.py").write_text(COMMANDS_SOURCE)
+        registry.refresh_integrations()
+
+        assert registry.get_integration_commands("pinger") is not None
+
+    def test_loads_project_commands_with_generic_app(self, custom_dirs):
+        """Test project commands.py exposing 'app' is used."""
+        _, project_dir = custom_dirs
+        (project_dir / "pinger").mkdir()
+        (project_dir / "pinger" / "commands.py").write_text("import typer\n\napp = typer.Typer()\n")
+        registry.refresh_integrations()
+
+        app = registry.get_integration_commands("pinger")
+
+        assert app is sys.modules["project_commands_pinger"].app
+
+    def test_broken_commands_module_is_unregistered(self, custom_dirs):
+        """Test a commands.py that raises is ignored and not left in sys.modules."""
+        global_dir, _ = custom_dirs
+        (global_dir / "pinger").mkdir()
+        (global_dir / "pinger" / "commands.py").write_text("raise RuntimeError('broken')\n")
+        registry.refresh_integrations()
+
+        assert registry.get_integration_commands("pinger") is None
+        assert "global_commands_pinger" not in sys.modules
+
+
+class TestIntegrationsByType:
+    """Tests for get_integrations_by_type."""
+
+    def test_groups_by_type(self, custom_dirs):
+        """Test integrations are listed under their type only."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        assert "pinger" in registry.get_integrations_by_type(IntegrationType.NOTIFICATION)
+        assert "pinger" not in registry.get_integrations_by_type(IntegrationType.CI_CD)
+
+    def test_returns_copy(self, custom_dirs):
+        """Test callers cannot mutate the cached index."""
+        global_dir, _ = custom_dirs
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        registry.get_integrations_by_type(IntegrationType.NOTIFICATION).clear()
+
+        assert "pinger" in registry.get_integrations_by_type(IntegrationType.NOTIFICATION)
+
+    def test_index_rebuilt_after_refresh(self, custom_dirs):
+        """Test newly installed integrations show up after refresh."""
+        global_dir, _ = custom_dirs
+        registry.refresh_integrations()
+        assert registry.get_integrations_by_type(IntegrationType.NOTIFICATION) == []
+
+        _write_integration(global_dir, "pinger")
+        registry.refresh_integrations()
+
+        assert registry.get_integrations_by_type(IntegrationType.NOTIFICATION) == ["pinger"]
@@ -0,0 +1,380 @@
+"""
+Unit tests for redgit.plugins.registry module.
+"""
+
+import sys
+
+import pytest
+from pathlib import Path
+
+from redgit.plugins import registry
+
+
+PLUGIN_SOURCE = '''
+class {class_name}:
+    name = "{name}"
+    origin = "{origin}"
+
+    def match(self):
+        return {matches}
+'''
+
+COMMANDS_SOURCE = '''
+import typer
+
+{name}_app = typer.Typer(help="{name} commands")
+
+
+def release_shortcut():
+    return "released"
+'''
+
+
+def _write_plugin(directory: Path, name: str, matches: bool = True) -> Path:
+    """Write a minimal package plugin into directory."""
+    class_name = f"{name.capitalize()}Plugin"
+    path = directory / name / "__init__.py"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(PLUGIN_SOURCE.format(
+        class_name=class_name, name=name, origin=directory.name, matches=matches
+    ))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _clear_plugin_cache():
+    """Reset plugin registry caches so tests don't share loaded plugins."""
+    registry.clear_plugin_cache()
+    yield
+    registry.clear_plugin_cache()
+
+
+@pytest.fixture
+def plugin_dirs(temp_dir, monkeypatch):
+    """Point global and project plugin dirs at a temp directory."""
+    global_dir = temp_dir / "global"
+    project_dir = temp_dir / "project"
+    global_dir.mkdir()
+    project_dir.mkdir()
+    monkeypatch.setattr(registry, "GLOBAL_PLUGINS_PATH", global_dir)
+    monkeypatch.setattr(registry, "PROJECT_PLUGINS_DIR", project_dir)
+    return global_dir, project_dir
+
+
+class TestScanPluginDir:
+    """Tests for _scan_plugin_dir function."""
+
+    def test_finds_packages(self, temp_dir):
+        """Test package plugins are mapped to their __init__.py."""
+        _write_plugin(temp_dir, "demo")
+        (temp_dir / "empty").mkdir()
+
+        found = registry._scan_plugin_dir(temp_dir)
+
+        assert found == {"demo": temp_dir / "demo" / "__init__.py"}
+
+    def test_files_only_when_allowed(self, temp_dir):
+        """Test single file plugins need allow_files."""
+        (temp_dir / "single.py").write_text("")
+
+        assert registry._scan_plugin_dir(temp_dir) == {}
+        assert registry._scan_plugin_dir(temp_dir, allow_files=True) == {
+            "single": temp_dir / "single.py"
+        }
+
+    def test_file_wins_over_package(self, temp_dir):
+        """Test name.py takes precedence over name/__init__.py."""
+        _write_plugin(temp_dir, "demo")
+        (temp_dir / "demo.py").write_text("")
+
+        found = registry._scan_plugin_dir(temp_dir, allow_files=True)
+
+        assert found["demo"] == temp_dir / "demo.py"
+
+    def test_missing_directory(self, temp_dir):
+        """Test a missing directory yields no plugins."""
+        assert registry._scan_plugin_dir(temp_dir / "missing") == {}
+
+
+class TestGetAllPlugins:
+    """Tests for get_all_plugins function."""
+
+    def test_merges_global_and_project(self, plugin_dirs):
+        """Test plugins from both directories are listed once."""
+        global_dir, project_dir = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        _write_plugin(global_dir, "shared")
+        _write_plugin(project_dir, "shared")
+
+        assert sorted(registry.get_all_plugins()) == ["demo", "shared"]
+
+
+class TestLoadPlugin:
+    """Tests for plugin loading."""
+
+    def test_loads_global_plugin(self, plugin_dirs):
+        """Test a tap-installed plugin is instantiated."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+
+        plugin = registry.get_plugin_by_name("demo")
+
+        assert type(plugin).__name__ == "DemoPlugin"
+
+    def test_project_overrides_global(self, plugin_dirs):
+        """Test project plugins take precedence."""
+        global_dir, project_dir = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        _write_plugin(project_dir, "demo")
+
+        assert registry.get_plugin_by_name("demo").origin == "project"
+
+    def test_missing_plugin_returns_none(self, plugin_dirs):
+        """Test unknown plugins return None."""
+        assert registry.get_plugin_by_name("nope") is None
+
+    def test_load_plugins_uses_enabled_list(self, plugin_dirs):
+        """Test load_plugins only loads enabled plugins."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        _write_plugin(global_dir, "other")
+
+        plugins = registry.load_plugins({"enabled": ["demo", "missing"]})
+
+        assert list(plugins) == ["demo"]
+
+    def test_registers_module(self, plugin_dirs):
+        """Test loaded plugin modules are registered in sys.modules."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+
+        plugin = registry.get_plugin_by_name("demo")
+
+        assert sys.modules["global_plugin_demo"].DemoPlugin is type(plugin)
+
+    def test_broken_plugin_is_unregistered(self, plugin_dirs):
+        """Test a plugin that fails to import is dropped from sys.modules."""
+        global_dir, _ = plugin_dirs
+        path = global_dir / "broken" / "__init__.py"
+        path.parent.mkdir()
+        path.write_text("raise RuntimeError('boom')\n")
+
+        assert registry.get_plugin_by_name("broken") is None
+        assert "global_plugin_broken" not in sys.modules
+
+    def test_plugin_without_class_is_unregistered(self, plugin_dirs):
+        """Test a module lacking the plugin class is dropped from sys.modules."""
+        global_dir, _ = plugin_dirs
+        path = global_dir / "noclass" / "__init__.py"
+        path.parent.mkdir()
+        path.write_text("VALUE = 1\n")
+
+        assert registry.get_plugin_by_name("noclass") is None
+        assert "global_plugin_noclass" not in sys.modules
+
+    def test_broken_project_plugin_keeps_global_module(self, plugin_dirs):
+        """Test a failing project plugin does not unregister the global one."""
+        global_dir, project_dir = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        path = project_dir / "demo" / "__init__.py"
+        path.parent.mkdir()
+        path.write_text("raise RuntimeError('boom')\n")
+
+        plugin = registry.get_plugin_by_name("demo")
+
+        assert plugin.origin == "global"
+        assert sys.modules["global_plugin_demo"].DemoPlugin is type(plugin)
+        assert "project_plugin_demo" not in sys.modules
+
+
+class TestPluginCache:
+    """Tests for plugin lookup caching."""
+
+    def test_plugin_instance_is_cached(self, plugin_dirs):
+        """Test repeated lookups return the same instance."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+
+        assert registry.get_plugin_by_name("demo") is registry.get_plugin_by_name("demo")
+
+    def test_cwd_change_uses_other_project(self, temp_dir, monkeypatch):
+        """Test a cached lookup is not reused for a different project directory."""
+        monkeypatch.setattr(registry, "GLOBAL_PLUGINS_PATH", temp_dir / "global")
+        _write_plugin(temp_dir / "one" / ".redgit" / "plugins", "demo", matches=True)
+        _write_plugin(temp_dir / "two" / ".redgit" / "plugins", "demo", matches=False)
+
+        monkeypatch.chdir(temp_dir / "one")
+        first = registry.get_plugin_by_name("demo")
+        monkeypatch.chdir(temp_dir / "two")
+        second = registry.get_plugin_by_name("demo")
+
+        assert first.match() is True
+        assert second.match() is False
+
+    def test_cwd_change_uses_other_project_commands(self, temp_dir, monkeypatch):
+        """Test project commands are looked up again after a cwd change."""
+        monkeypatch.setattr(registry, "GLOBAL_PLUGINS_PATH", temp_dir / "global")
+        for project in ("one", "two"):
+            commands = temp_dir / project / ".redgit" / "plugins" / "demo" / "commands.py"
+            commands.parent.mkdir(parents=True)
+            commands.write_text(f"import typer\napp = typer.Typer(help='{project}')\n")
+
+        monkeypatch.chdir(temp_dir / "one")
+        first = registry.get_plugin_commands("demo")
+        monkeypatch.chdir(temp_dir / "two")
+        second = registry.get_plugin_commands("demo")
+
+        assert first.info.help == "one"
+        assert second.info.help == "two"
+
+    def test_clear_plugin_cache_reloads(self, plugin_dirs):
+        """Test clear_plugin_cache forces a fresh load."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        first = registry.get_plugin_by_name("demo")
+
+        registry.clear_plugin_cache()
+
+        assert registry.get_plugin_by_name("demo") is not first
+
+    def test_plugin_commands_are_cached(self, plugin_dirs):
+        """Test the commands app is loaded once."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        (global_dir / "demo" / "commands.py").write_text(COMMANDS_SOURCE.format(name="demo"))
+
+        app = registry.get_plugin_commands("demo")
+
+        assert app is not None
+        assert registry.get_plugin_commands("demo") is app
+
+    def test_project_commands_fallback(self, plugin_dirs):
+        """Test project commands.py exposing app is used."""
+        _, project_dir = plugin_dirs
+        _write_plugin(project_dir, "demo")
+        (project_dir / "demo" / "commands.py").write_text(
+            "import typer\napp = typer.Typer()\n"
+        )
+
+        assert registry.get_plugin_commands("demo") is not None
+
+    def test_clear_plugin_cache_drops_commands_modules(self, plugin_dirs):
+        """Test clear_plugin_cache removes custom commands modules."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        (global_dir / "demo" / "commands.py").write_text(COMMANDS_SOURCE.format(name="demo"))
+        registry.get_plugin_commands("demo")
+        assert "global_plugin_commands_demo" in sys.modules
+
+        registry.clear_plugin_cache()
+
+        assert "global_plugin_commands_demo" not in sys.modules
+
+
+class TestLoadCommandsModule:
+    """Tests for _load_commands_module function."""
+
+    def test_reuses_loaded_module(self, temp_dir):
+        """Test a module already in sys.modules is returned as is."""
+        path = temp_dir / "commands.py"
+        path.write_text("VALUE = 1\n")
+
+        first = registry._load_commands_module("global_plugin_commands_reuse", path)
+        path.write_text("VALUE = 2\n")
+        second = registry._load_commands_module("global_plugin_commands_reuse", path)
+
+        assert second is first
+        assert second.VALUE == 1
+
+    def test_missing_builtin_returns_none(self):
+        """Test a builtin plugin without commands returns None."""
+        assert registry._load_commands_module("redgit.plugins.nope.commands") is None
+
+    def test_broken_file_is_unregistered(self, temp_dir):
+        """Test a commands file that fails to import is not left registered."""
+        path = temp_dir / "commands.py"
+        path.write_text("raise RuntimeError('boom')\n")
+
+        assert registry._load_commands_module("global_plugin_commands_broken", path) is None
+        assert "global_plugin_commands_broken" not in sys.modules
+
+
+class TestPluginShortcuts:
+    """Tests for get_plugin_shortcuts function."""
+
+    def test_extracts_shortcuts_and_apps(self, plugin_dirs):
+        """Test *_shortcut functions and extra Typer apps are collected."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        (global_dir / "demo" / "commands.py").write_text(
+            COMMANDS_SOURCE.format(name="demo") + "\nrelease_app = typer.Typer()\n"
+        )
+
+        shortcuts = registry.get_plugin_shortcuts("demo")
+
+        assert set(shortcuts) == {"release"}
+
+    def test_shortcut_function_wins_over_app(self, plugin_dirs):
+        """Test a *_shortcut function takes precedence over a *_app."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        (global_dir / "demo" / "commands.py").write_text(
+            COMMANDS_SOURCE.format(name="demo") + "\nrelease_app = typer.Typer()\n"
+        )
+
+        shortcuts = registry.get_plugin_shortcuts("demo")
+
+        assert shortcuts["release"]() == "released"
+
+    def test_declared_shortcuts(self, plugin_dirs):
+        """Test a SHORTCUTS dict replaces the name scan."""
+        global_dir, _ = plugin_dirs
+        _write_plugin(global_dir, "demo")
+        (global_dir / "demo" / "commands.py").write_text(
+            COMMANDS_SOURCE.format(name="demo") + "\nSHORTCUTS = {'ship': release_shortcut}\n"
+        )
+
+        shortcuts = registry.get_plugin_shortcuts("demo")
+
+        assert list(shortcuts) == ["ship"]
+
+
+class _MatchPlugin:
+    """Plugin stub recording match() calls."""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.calls = 0
+
+    def match(self):
+        self.calls += 1
+        return self.matches
+
+
+class TestGetActivePlugin:
+    """Tests for get_active_plugin function."""
+
+    def test_returns_first_match(self):
+        """Test plugins are tried in order without hints."""
+        plugins = {"a": _MatchPlugin(False), "b": _MatchPlugin(True), "c": _MatchPlugin(True)}
+
+        assert registry.get_active_plugin(plugins) is plugins["b"]
+        assert plugins["c"].calls == 0
+
+    def test_hinted_plugin_tried_first(self):
+        """Test a hinted plugin is matched before the others."""
+        plugins = {"a": _MatchPlugin(True), "b": _MatchPlugin(True)}
+
+        assert registry.get_active_plugin(plugins, ["b"]) is plugins["b"]
+        assert plugins["a"].calls == 0
+
+    def test_falls_back_after_hints(self):
+        """Test remaining plugins are tried once when hints don't match."""
+        plugins = {"a": _MatchPlugin(True), "b": _MatchPlugin(False)}
+
+        assert registry.get_active_plugin(plugins, ["b", "missing"]) is plugins["a"]
+        assert plugins["b"].calls == 1
+
+    def test_no_match(self):
+        """Test None is returned when nothing matches."""
+        assert registry.get_active_plugin({"a": object()}) is None
@@ -49,6 +49,20 @@ class TestGetUnpushedTags:
         result = _get_unpushed_tags(gitops)
         assert "v1.0.0" in result
 
+    def test_returns_nested_tag_names(self, temp_git_repo, change_cwd):
+        """Test tags with slashes are returned by their full name."""
+        import os
+        os.chdir(temp_git_repo)
+
+        from redgit.core.gitops import GitOps
+        gitops = GitOps()
+
+        gitops.repo.git.tag("release/1.0")
+        gitops.repo.git.tag("v2.0.0")
+
+        result = _get_unpushed_tags(gitops)
+        assert sorted(result) == ["release/1.0", "v2.0.0"]
+
     def test_returns_list_type(self, temp_git_repo, change_cwd):
         """Test always returns a list."""
         import os